@@ -0,0 +1,47 @@
+"""
+Benchmark the maze generators against each other.
+Run from the project root: python -m benchmarks.generators
+"""
+
+import random
+
+from generation_algorithms.aldous_broder import (
+    generate_aldous_broder_maze,
+    generate_aldous_broder_maze_fast,
+)
+from generation_algorithms.kruskal import generate_kruskal_maze
+from generation_algorithms.random_dfs import generate_random_dfs_maze
+from generation_algorithms.registry import MazeGenerator
+from generation_algorithms.tiled import generate_tiled_maze
+from generation_algorithms.wilson import (
+    generate_aldous_broder_wilson_maze,
+    generate_wilson_maze,
+)
+from utils.helpers import measure_generation
+
+
+def main(sizes: tuple[int, ...] = (25, 50, 100), seed: int = 0) -> None:
+    generators: dict[str, MazeGenerator] = {
+        "aldous_broder": generate_aldous_broder_maze,
+        "aldous_broder_fast": generate_aldous_broder_maze_fast,
+        "wilson": generate_wilson_maze,
+        "aldous_broder_wilson": generate_aldous_broder_wilson_maze,
+        "random_dfs": generate_random_dfs_maze,
+        "kruskal": generate_kruskal_maze,
+        "tiled_random_dfs": generate_tiled_maze,
+    }
+
+    for size in sizes:
+        for name, generate in generators.items():
+            _, cells_per_second = measure_generation(
+                generate, size, size, rng=random.Random(seed)
+            )
+            print(
+                f"{name:<22} {size:>5}x{size:<5} "
+                f"{size * size / cells_per_second:>8.3f} s "
+                f"{cells_per_second:>12,.0f} cells/s"
+            )
+
+
+if __name__ == "__main__":
+    main()
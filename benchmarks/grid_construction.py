@@ -0,0 +1,48 @@
+"""
+Benchmark the construction cost of Cells and Grids.
+Run from the project root: python -m benchmarks.grid_construction
+"""
+
+import time
+import tracemalloc
+from collections.abc import Callable
+
+from components.cell import Cell
+from components.grid import Grid
+
+
+def measure(build: Callable[[], object], cells: int) -> tuple[float, float]:
+    """
+    Build an object once under tracemalloc.
+    :param build: Function building the object to measure.
+    :param cells: Number of cells the object holds.
+    :return: (seconds, bytes per cell) to build it.
+    """
+    tracemalloc.start()
+    start = time.perf_counter()
+    built = build()
+    seconds = time.perf_counter() - start
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del built
+    return seconds, current / cells
+
+
+def main(rows: int = 300, cols: int = 300) -> None:
+    cells = rows * cols
+    benchmarks: dict[str, Callable[[], object]] = {
+        "Cell x rows*cols": lambda: [
+            [Cell((r, c)) for c in range(cols)] for r in range(rows)
+        ],
+        "Grid": lambda: Grid(rows, cols),
+        "Grid.create_grid": lambda: Grid(rows, cols).create_grid(),
+    }
+
+    print(f"{rows}x{cols} ({cells} cells)")
+    for name, build in benchmarks.items():
+        seconds, bytes_per_cell = measure(build, cells)
+        print(f"{name:<20} {seconds * 1000:>10.1f} ms {bytes_per_cell:>10.1f} B/cell")
+
+
+if __name__ == "__main__":
+    main()
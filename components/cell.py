@@ -7,17 +7,19 @@ from constants import (
 )
 from utils.helpers import get_cell_content
 
-from enums.direction_enums import QuadDirection
+from enums.direction_enums import ALL_WALLS, WALL_BITS, QuadDirection
 from utils.validators import check_type
 
 
 class Cell:
+    # Slots and an int wall mask (see WALL_BITS) keep a Cell small and cheap to build
+    __slots__ = ("content", "is_visited", "pos", "walls")
+
     def __init__(self, pos: tuple[int, int], content: str = " "):
         self.pos: tuple[int, int] = pos
         self.content: str = get_cell_content(content)
-        self.is_visited = False
-        self.direction = QuadDirection
-        self.walls: dict[QuadDirection, bool] = {d: True for d in self.direction}
+        self.is_visited: bool = False
+        self.walls: int = ALL_WALLS
 
     def __str__(self) -> str:
         return "\n".join(self.get_cell_lines())
@@ -30,15 +32,15 @@ class Cell:
 
         # Top border
         top_line = self.build_cell_line(
-            is_left=None, is_middle=self.walls[QuadDirection.NORTH], is_right=None
+            is_left=None, is_middle=self.has_wall(QuadDirection.NORTH), is_right=None
         )
 
         # Middle get_cell_lines
         middle_lines = [
             self.build_cell_line(
-                is_left=self.walls[QuadDirection.WEST],
+                is_left=self.has_wall(QuadDirection.WEST),
                 is_middle=None,
-                is_right=self.walls[QuadDirection.EAST],
+                is_right=self.has_wall(QuadDirection.EAST),
                 has_content=True if i == CELL_HEIGHT // 2 else False,
             )
             for i in range(CELL_HEIGHT)
@@ -46,7 +48,7 @@ class Cell:
 
         # Bottom border
         bottom_line = self.build_cell_line(
-            is_left=None, is_middle=self.walls[QuadDirection.SOUTH], is_right=None
+            is_left=None, is_middle=self.has_wall(QuadDirection.SOUTH), is_right=None
         )
 
         return [top_line, *middle_lines, bottom_line]
@@ -89,11 +91,14 @@ class Cell:
 
         return side(is_left) + middle + side(is_right)
 
+    def has_wall(self, wall_direction: QuadDirection) -> bool:
+        return bool(self.walls & WALL_BITS[wall_direction])
+
     def remove_wall(self, wall_direction: QuadDirection) -> None:
         check_type(wall_direction, QuadDirection)
-        if wall_direction not in self.direction:
+        if wall_direction not in WALL_BITS:
             raise ValueError(f"{str(wall_direction)} is an invalid wall direction")
-        self.walls[wall_direction] = False
+        self.walls &= ~WALL_BITS[wall_direction]
 
     def set_cell_content(self, char: str) -> None:
         self.content = get_cell_content(char)
@@ -1,20 +1,94 @@
+import mmap
 import random
+from array import array
+from collections.abc import Iterator
+from itertools import compress
+from typing import TextIO
 
 from components.cell import QuadDirection, Cell
+from components.renderer import render_row
+from enums.direction_enums import ALL_WALLS, WALL_BITS
+from utils.mapped_files import map_temporary_file
+from utils.union_find import UnionFind
+from utils.validators import check_type
 
 
 class Grid:
-    def __init__(self, rows: int, cols: int):
+    """
+    A rows x cols maze.
+    The walls of all cells are stored as 4-bit masks (see WALL_BITS) in one flat bytearray
+    and the visited flags in a bit array, so a Grid costs roughly one byte per cell.
+    Connected regions take about 5 more bytes per cell, only once they are queried.
+    The Cells handed out by a Grid are views over this storage.
+    For mazes larger than RAM, the arrays can be kept in memory-mapped files instead.
+    """
+
+    def __init__(
+        self,
+        rows: int,
+        cols: int,
+        rng: random.Random | None = None,
+        directory: str | None = None,
+    ):
+        """
+        :param rng: Source of all the random draws made on and for this grid,
+                    e.g. random.Random(seed). Unseeded by default.
+        :param directory: Keep the walls, visited flags and regions in memory-mapped
+                          temporary files of this directory, on a local disk, instead of RAM.
+                          Pages are then loaded and written back by the OS as they are used,
+                          so generators should access the grid row by row, e.g. Eller.
+        """
         self.rows: int = rows
         self.cols: int = cols
-        self.grid: list[list[Cell]] = self.create_grid()
-        self.all_cells: list[tuple[int, int]] = self.get_cells()
+        self.rng: random.Random = rng if rng is not None else random.Random()
+        self.size: int = rows * cols
+        self.walls: bytearray | mmap.mmap
+        self.visited: bytearray | mmap.mmap
+        if directory is None:
+            self.walls = bytearray([ALL_WALLS]) * self.size
+            self.visited = bytearray((self.size + 7) // 8)
+        else:
+            self.walls = map_temporary_file(self.size, directory, fill=ALL_WALLS)
+            self.visited = map_temporary_file((self.size + 7) // 8, directory)
+        # Only cells with content other than " " are stored, keyed by cell index.
+        self.contents: dict[int, str] = {}
+        # Depths of the cells from each goal index, see solving_algorithms.distance_field,
+        # which bounds how many are kept (4 bytes per cell each). They are dropped
+        # whenever remove_grid_wall or set_walls changes the maze.
+        self.distance_fields: dict[int, array[int]] = {}
+        # Cells joined by open walls. Built by the first connectivity query, then kept up
+        # to date by remove_grid_wall; None before that and after set_walls.
+        self.regions: UnionFind | None = None
+        self.directory: str | None = directory
 
     def create_grid(self) -> list[list[Cell]]:
+        """
+        Materialise a view Cell for every position of the grid.
+        Prefer get_cell on large grids: this creates rows x cols objects.
+        """
         return [
-            [Cell((row, col)) for col in range(self.cols)] for row in range(self.rows)
+            [self.get_cell(row, col) for col in range(self.cols)]
+            for row in range(self.rows)
         ]
 
+    def get_cell(self, row: int, col: int) -> Cell:
+        return GridCell(self, (row, col))
+
+    def is_visited(self, index: int) -> bool:
+        return bool(self.visited[index >> 3] & (1 << (index & 7)))
+
+    def set_visited(self, index: int, is_visited: bool = True) -> None:
+        if is_visited:
+            self.visited[index >> 3] |= 1 << (index & 7)
+        else:
+            self.visited[index >> 3] &= ~(1 << (index & 7))
+
+    def set_all_visited(self) -> None:
+        full_bytes, remaining_bits = divmod(self.size, 8)
+        self.visited[:full_bytes] = b"\xff" * full_bytes
+        if remaining_bits:
+            self.visited[full_bytes] = (1 << remaining_bits) - 1
+
     def get_cell_coord_in_direction(
         self, cell: Cell, direction: QuadDirection
     ) -> tuple[int, int] | None:
@@ -27,62 +101,164 @@ class Grid:
 
         return nr, nc
 
+    def set_walls(self, index: int, walls: int) -> None:
+        """
+        Overwrite the wall mask of one cell, e.g. through a Cell view.
+        Unlike remove_grid_wall, the masks of the neighbours are left as they are.
+        """
+        self.walls[index] = walls
+        self.regions = None
+        if self.distance_fields:
+            self.distance_fields.clear()
+
     def remove_grid_wall(
         self, row: int, col: int, wall_direction: QuadDirection
     ) -> None:
-        self.grid[row][col].remove_wall(wall_direction)
+        check_type(wall_direction, QuadDirection)
+        self.walls[row * self.cols + col] &= ~WALL_BITS[wall_direction]
+        if self.distance_fields:
+            self.distance_fields.clear()
 
-        opposite_direction = wall_direction.get_opposite()
-        opposite_cell_coord = self.get_cell_coord_in_direction(
-            self.grid[row][col], wall_direction
-        )
+        dr, dc = wall_direction.value
+        nr, nc = row + dr, col + dc  # neighbour coord
 
-        if opposite_cell_coord:
-            nr, nc = opposite_cell_coord
-            self.grid[nr][nc].remove_wall(opposite_direction)
+        if 0 <= nr < self.rows and 0 <= nc < self.cols:
+            opposite_direction = wall_direction.get_opposite()
+            self.walls[nr * self.cols + nc] &= ~WALL_BITS[opposite_direction]
+            if self.regions is not None:
+                self.regions.union(row * self.cols + col, nr * self.cols + nc)
+
+    def get_regions(self) -> UnionFind:
+        """
+        Get the connected regions of the grid, building them from the walls if needed.
+        """
+        if self.regions is None:
+            self.regions = get_wall_regions(
+                self.walls, self.rows, self.cols, self.directory
+            )
+        return self.regions
+
+    def invalidate_regions(self) -> None:
+        """
+        Drop the connected regions after writing self.walls directly, so that the next
+        connectivity query builds them again from the walls.
+        """
+        self.regions = None
+
+    def count_regions(self) -> int:
+        """
+        Count the sets of cells connected to each other, 1 for a connected maze.
+        """
+        return self.get_regions().count
+
+    def are_connected(self, pos: tuple[int, int], other_pos: tuple[int, int]) -> bool:
+        """
+        Check whether there is a path between two cells, given as (row, column).
+        """
+        return self.get_regions().is_connected(
+            pos[0] * self.cols + pos[1], other_pos[0] * self.cols + other_pos[1]
+        )
 
     def __str__(self) -> str:
-        lines: list[str] = []
-
-        for r, row in enumerate(self.grid):
-            # Prepare lists of cell_lines for each cell
-            row_lines = [cell.get_cell_lines() for cell in row]
-
-            # To avoid repeated row borders: the south line of all cells except for the last is skipped
-            if r < len(self.grid) - 1:
-                for lines_of_cell in row_lines:
-                    lines_of_cell.pop()
-
-            # Merge each line of all cells in the row
-            for i in range(len(row_lines[0])):  # top/middle/bottom
-                merged_line = ""
-                for j, cell_line in enumerate(row_lines):
-                    if j == 0:
-                        merged_line += cell_line[i]  # include left wall of first cell
-                    else:
-                        # Skip first char of each subsequent cell to avoid double left wall
-                        merged_line += cell_line[i][1:]
-                lines.append(merged_line)
-
-        return "\n".join(lines)
+        return "\n".join(self.iter_lines())
+
+    def iter_lines(self) -> Iterator[str]:
+        """
+        Yield the rendered lines of the maze, top to bottom.
+        Only the lines of one maze row are held in memory at a time.
+        """
+        for r, row_contents in enumerate(self.iter_row_contents()):
+            yield from render_row(
+                self.get_row_walls(r),
+                row_contents,
+                is_last_row=r == self.rows - 1,
+            )
+
+    def write_to(self, file: TextIO, chunk_rows: int = 64) -> None:
+        """
+        Write the rendered maze to a text file object, ending with a newline.
+        :param file: File object to write to, e.g. sys.stdout or an open file.
+        :param chunk_rows: Number of maze rows rendered per write call.
+        """
+        if chunk_rows < 1:
+            raise ValueError("The number of rows per chunk must be at least 1")
+
+        chunk: list[str] = []
+
+        for r, row_contents in enumerate(self.iter_row_contents()):
+            is_last_row = r == self.rows - 1
+            chunk.extend(render_row(self.get_row_walls(r), row_contents, is_last_row))
+            if is_last_row or (r + 1) % chunk_rows == 0:
+                chunk.append("")  # ends the chunk with a newline
+                file.write("\n".join(chunk))
+                chunk.clear()
+
+    def get_row_walls(self, row: int) -> bytes | bytearray:
+        return self.walls[row * self.cols : (row + 1) * self.cols]
+
+    def get_row_contents(self, row: int) -> dict[int, str]:
+        """
+        Get the non-empty contents of a row keyed by column.
+        """
+        start = row * self.cols
+        return {
+            index - start: content
+            for index, content in self.contents.items()
+            if start <= index < start + self.cols
+        }
+
+    def iter_row_contents(self) -> Iterator[dict[int, str]]:
+        """
+        Yield the non-empty contents of each row keyed by column, top to bottom.
+        The content indices are sorted once, so a full pass is not O(rows x contents).
+        """
+        indices = sorted(self.contents)
+        i = 0
+
+        for row in range(self.rows):
+            start, end = row * self.cols, (row + 1) * self.cols
+            row_contents: dict[int, str] = {}
+            while i < len(indices) and indices[i] < end:
+                row_contents[indices[i] - start] = self.contents[indices[i]]
+                i += 1
+            yield row_contents
 
     def get_cells(self) -> list[tuple[int, int]]:
-        return [(r, c) for r, row in enumerate(self.grid) for c, cell in enumerate(row)]
+        return [(r, c) for r in range(self.rows) for c in range(self.cols)]
+
+    def get_border_cells(self) -> list[tuple[int, int]]:
+        if self.rows == 1 or self.cols == 1:
+            return self.get_cells()
+
+        top = [(0, c) for c in range(self.cols)]
+        bottom = [(self.rows - 1, c) for c in range(self.cols)]
+        sides = [(r, c) for r in range(1, self.rows - 1) for c in (0, self.cols - 1)]
+        return top + sides + bottom
 
     def _get_random_cell(self, cells: list[tuple[int, int]]) -> Cell:
-        r, c = random.choice(cells)
-        return self.grid[r][c]
+        r, c = self.rng.choice(cells)
+        return self.get_cell(r, c)
 
     def get_random_any_cell(self) -> Cell:
-        return self._get_random_cell(self.all_cells)
+        r, c = divmod(self.rng.randrange(self.size), self.cols)
+        return self.get_cell(r, c)
+
+    def get_random_any_cell_except(self, cell: Cell) -> Cell:
+        """
+        Get a random cell other than the given one, e.g. a goal away from the entrance.
+        The single cell of a 1x1 grid is returned as is.
+        """
+        if self.size == 1:
+            return cell
+
+        excluded = cell.pos[0] * self.cols + cell.pos[1]
+        index = self.rng.randrange(self.size - 1)
+        if index >= excluded:
+            index += 1
+        return self.get_cell(*divmod(index, self.cols))
 
     def get_random_border_cell(self) -> Cell:
-        border_cells = [
-            (r, c)
-            for r, c in self.get_cells()
-            if r == 0 or r == self.rows - 1 or c == 0 or c == self.cols - 1
-        ]
-        return self._get_random_cell(border_cells)
+        return self._get_random_cell(self.get_border_cells())
 
     def open_maze(self, border_cell: Cell) -> None:
         # If the cell is a border cell, then remove the outer border, opening up the maze
@@ -97,25 +273,25 @@ class Grid:
         # top left corner
         if border_cell.pos == (0, 0):
             self.remove_grid_wall(
-                r, c, random.choice([QuadDirection.NORTH, QuadDirection.WEST])
+                r, c, self.rng.choice([QuadDirection.NORTH, QuadDirection.WEST])
             )
 
         # top right corner
         if border_cell == (0, self.cols - 1):
             self.remove_grid_wall(
-                r, c, random.choice([QuadDirection.NORTH, QuadDirection.EAST])
+                r, c, self.rng.choice([QuadDirection.NORTH, QuadDirection.EAST])
             )
 
         # bottom left corner
         if border_cell == (self.rows - 1, 0):
             self.remove_grid_wall(
-                r, c, random.choice([QuadDirection.SOUTH, QuadDirection.WEST])
+                r, c, self.rng.choice([QuadDirection.SOUTH, QuadDirection.WEST])
             )
 
         # bottom right corner
         if border_cell == (self.rows - 1, self.cols - 1):
             self.remove_grid_wall(
-                r, c, random.choice([QuadDirection.SOUTH, QuadDirection.EAST])
+                r, c, self.rng.choice([QuadDirection.SOUTH, QuadDirection.EAST])
             )
 
         # north border cell
@@ -141,54 +317,116 @@ class Grid:
         returns a tuple of the random neighbor Cell and its direction relative to the current cell
         or None if the cells in all 4 get_directions are visited
         """
-        neighbors: list[tuple[Cell, QuadDirection]] = []
+        neighbors: list[tuple[tuple[int, int], QuadDirection]] = []
 
         for direction in QuadDirection:
             n_cell_coord = self.get_cell_coord_in_direction(cell, direction)
 
             if n_cell_coord:
-                nr, nc = n_cell_coord
-                neighbors.append((self.grid[nr][nc], direction))
+                neighbors.append((n_cell_coord, direction))
 
         if neighbors:
-            return random.choice(neighbors)
+            # Only the chosen neighbour gets a Cell view
+            (nr, nc), direction = self.rng.choice(neighbors)
+            return self.get_cell(nr, nc), direction
         return None
 
-    def get_accessible_neighbours(self, cell):
+    def get_accessible_neighbours(self, cell: Cell) -> list[tuple[QuadDirection, Cell]]:
         """
         Return a list of (direction, neighbour_cell) tuples where there is no wall.
         """
         accessible = []
+        r, c = cell.pos
+        mask = self.walls[r * self.cols + c]
 
-        for direction in QuadDirection:  # assuming your directions are in an enum
+        for direction, bit in WALL_BITS.items():
+            if mask & bit:
+                continue  # there is a wall in that direction
             coord = self.get_cell_coord_in_direction(cell, direction)
             if coord is None:
                 continue  # out of bounds
-            r, c = coord
-            neighbour = self.grid[r][c]
-            # Check if there is no wall in that direction
-            if not cell.walls[direction]:  # assuming walls dict uses QuadDirection keys
-                accessible.append((direction, neighbour))
+            accessible.append((direction, self.get_cell(*coord)))
 
         return accessible
 
-    def all_cells_accessible(self):
-        # Pick a random starting cell
-        start_cell = self.get_random_any_cell()
-        start_cell.is_visited = True
-
-        visited = set()
-        stack = [start_cell]
-
-        while stack:
-            cell = stack.pop()
-            if cell.pos in visited:
-                continue
-            visited.add(cell.pos)
-
-            # Check neighbors that are accessible (no wall between)
-            for direction, neighbour in self.get_accessible_neighbours(cell):
-                if neighbour.pos not in visited:
-                    stack.append(neighbour)
-
-        return len(visited) == self.rows * self.cols
+    def all_cells_accessible(self) -> bool:
+        return self.get_regions().count == 1
+
+
+# Bytes translation tables giving 1 for the masks without the wall, else 0
+_IS_OPEN_EAST: bytes = bytes(
+    0 if mask & WALL_BITS[QuadDirection.EAST] else 1 for mask in range(256)
+)
+_IS_OPEN_SOUTH: bytes = bytes(
+    0 if mask & WALL_BITS[QuadDirection.SOUTH] else 1 for mask in range(256)
+)
+
+
+def get_wall_regions(
+    walls: bytes | bytearray | mmap.mmap,
+    rows: int,
+    cols: int,
+    directory: str | None = None,
+) -> UnionFind:
+    """
+    Build the sets of cells connected by open walls from the wall masks of a grid.
+    Only the east and south walls of each cell are read. The open walls of a row are found
+    with bytes.translate, and the walls are read row by row, which suits mapped files.
+    :param directory: See UnionFind.
+    """
+    regions = UnionFind(rows * cols, directory)
+    union = regions.union
+
+    for row in range(rows):
+        start = row * cols
+        masks = walls[start : start + cols]
+        east_indices = range(start, start + cols - 1)
+        for index in compress(east_indices, masks[:-1].translate(_IS_OPEN_EAST)):
+            union(index, index + 1)
+        if row < rows - 1:
+            south_indices = range(start, start + cols)
+            for index in compress(south_indices, masks.translate(_IS_OPEN_SOUTH)):
+                union(index, index + cols)
+
+    return regions
+
+
+class GridCell(Cell):
+    """
+    A Cell whose walls, visited flag and content live in the arrays of its Grid.
+    Views are cheap to create and are not kept by the Grid.
+    """
+
+    __slots__ = ("grid", "index")
+
+    def __init__(self, grid: Grid, pos: tuple[int, int]):
+        self.grid: Grid = grid
+        self.pos = pos
+        self.index: int = pos[0] * grid.cols + pos[1]
+
+    @property  # type: ignore[override]
+    def walls(self) -> int:
+        return self.grid.walls[self.index]
+
+    @walls.setter
+    def walls(self, walls: int) -> None:
+        self.grid.set_walls(self.index, walls)
+
+    @property  # type: ignore[override]
+    def is_visited(self) -> bool:
+        return self.grid.is_visited(self.index)
+
+    @is_visited.setter
+    def is_visited(self, is_visited: bool) -> None:
+        self.grid.set_visited(self.index, is_visited)
+
+    @property  # type: ignore[override]
+    def content(self) -> str:
+        return self.grid.contents.get(self.index, " ")
+
+    @content.setter
+    def content(self, content: str) -> None:
+        if content == " ":
+            self.grid.contents.pop(self.index, None)
+        else:
+            self.grid.contents[self.index] = content
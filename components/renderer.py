@@ -0,0 +1,77 @@
+"""
+Render wall masks as text, one maze row at a time.
+A row is rendered with str.translate over its wall masks, using line tokens precomputed
+for every possible mask, so a row costs a few C-level passes instead of per-cell strings.
+The output matches Cell.get_cell_lines merged cell by cell.
+"""
+
+from constants import (
+    CELL_HEIGHT,
+    CELL_WIDTH,
+    HORIZONTAL_CHAR,
+    IN_BETWEEN_CELLS_CHAR,
+    VERTICAL_CHAR,
+)
+from enums.direction_enums import ALL_WALLS, WALL_BITS, QuadDirection
+
+NORTH_BIT: int = WALL_BITS[QuadDirection.NORTH]
+SOUTH_BIT: int = WALL_BITS[QuadDirection.SOUTH]
+EAST_BIT: int = WALL_BITS[QuadDirection.EAST]
+WEST_BIT: int = WALL_BITS[QuadDirection.WEST]
+
+# Each cell contributes its middle part and its right side; the left side of a cell is
+# the right side of its west neighbour, except for the first cell of the row.
+_NORTH_TOKENS: dict[int, str] = {
+    mask: (HORIZONTAL_CHAR if mask & NORTH_BIT else " ") * CELL_WIDTH
+    + IN_BETWEEN_CELLS_CHAR
+    for mask in range(ALL_WALLS + 1)
+}
+_SOUTH_TOKENS: dict[int, str] = {
+    mask: (HORIZONTAL_CHAR if mask & SOUTH_BIT else " ") * CELL_WIDTH
+    + IN_BETWEEN_CELLS_CHAR
+    for mask in range(ALL_WALLS + 1)
+}
+_CONTENT_TOKENS: dict[int, str] = {
+    mask: " ".center(CELL_WIDTH) + (VERTICAL_CHAR if mask & EAST_BIT else " ")
+    for mask in range(ALL_WALLS + 1)
+}
+# Middle lines without content have a single space as middle part (see Cell.build_cell_line)
+_BLANK_TOKENS: dict[int, str] = {
+    mask: " " + (VERTICAL_CHAR if mask & EAST_BIT else " ")
+    for mask in range(ALL_WALLS + 1)
+}
+
+
+def render_row(
+    masks: bytes | bytearray,
+    contents: dict[int, str] | None = None,
+    is_last_row: bool = False,
+) -> list[str]:
+    """
+    Render the lines of one maze row: its top border and middle lines.
+    :param masks: Wall masks of the cells in the row, one byte per cell.
+    :param contents: Content of the cells in the row keyed by column. Missing cells are empty.
+    :param is_last_row: Also render the bottom border of the row.
+    :return: CELL_HEIGHT + 1 lines, or CELL_HEIGHT + 2 lines for the last row.
+    """
+    # One char per cell, its code point being the mask of the cell
+    row = bytes(masks).decode("latin-1")
+    west_side = VERTICAL_CHAR if masks[0] & WEST_BIT else " "
+
+    lines = [IN_BETWEEN_CELLS_CHAR + row.translate(_NORTH_TOKENS)]
+
+    for i in range(CELL_HEIGHT):
+        if i != CELL_HEIGHT // 2:
+            lines.append(west_side + row.translate(_BLANK_TOKENS))
+            continue
+
+        line = west_side + row.translate(_CONTENT_TOKENS)
+        for col, char in sorted((contents or {}).items()):
+            start = 1 + col * (CELL_WIDTH + 1)
+            line = line[:start] + char.center(CELL_WIDTH) + line[start + CELL_WIDTH :]
+        lines.append(line)
+
+    if is_last_row:
+        lines.append(IN_BETWEEN_CELLS_CHAR + row.translate(_SOUTH_TOKENS))
+
+    return lines
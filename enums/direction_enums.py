@@ -19,3 +19,13 @@ class QuadDirection(Enum):
             self.EAST: self.WEST,
             self.WEST: self.EAST,
         }[self]
+
+
+# Bit of each wall in a cell's 4-bit wall mask. A set bit means the wall exists.
+WALL_BITS: dict[QuadDirection, int] = {
+    QuadDirection.NORTH: 0b0001,
+    QuadDirection.SOUTH: 0b0010,
+    QuadDirection.EAST: 0b0100,
+    QuadDirection.WEST: 0b1000,
+}
+ALL_WALLS: int = 0b1111
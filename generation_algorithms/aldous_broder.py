@@ -1,10 +1,20 @@
 # Aldous Broder: https://tinyurl.com/y78a2edz
 
+import random
+from collections.abc import Iterator
+
 from components.grid import Grid
+from generation_algorithms.random_walk import (
+    get_step_bases,
+    get_step_table,
+    iter_random_steps,
+)
 
 
-def generate_aldous_broder_maze(grid_rows: int, grid_cols: int) -> Grid:
-    grid = Grid(grid_rows, grid_cols)
+def generate_aldous_broder_maze(
+    grid_rows: int, grid_cols: int, rng: random.Random | None = None
+) -> Grid:
+    grid = Grid(grid_rows, grid_cols, rng)
     start_char = "X"
     current_cell = grid.get_random_border_cell()
     grid.open_maze(current_cell)
@@ -29,3 +39,70 @@ def generate_aldous_broder_maze(grid_rows: int, grid_cols: int) -> Grid:
     current_cell.set_cell_content(start_char)
     return grid
 
+
+def generate_aldous_broder_maze_fast(
+    grid_rows: int, grid_cols: int, rng: random.Random | None = None
+) -> Grid:
+    """
+    Aldous Broder with the same random walk as generate_aldous_broder_maze,
+    so mazes follow the same uniform spanning tree distribution.
+    A step is a few lookups in precomputed neighbour tables and the random
+    steps are drawn in batches, which makes it suitable for large grids.
+    """
+    grid = Grid(grid_rows, grid_cols, rng)
+    start_char = "X"
+    start_cell = grid.get_random_border_cell()
+    grid.open_maze(start_cell)
+
+    # A byte per cell is faster to test than the grid's visited bit array
+    visited = bytearray(grid.size)
+    current = start_cell.pos[0] * grid.cols + start_cell.pos[1]
+    visited[current] = 1
+    grid.set_visited(current)
+
+    current = walk_aldous_broder(
+        grid, visited, current, grid.size - 1, iter_random_steps(grid.rng)
+    )
+
+    grid.get_cell(*divmod(current, grid.cols)).set_cell_content(start_char)
+    return grid
+
+
+def walk_aldous_broder(
+    grid: Grid,
+    visited: bytearray,
+    current: int,
+    visit_count: int,
+    steps: Iterator[int],
+) -> int:
+    """
+    Random walk from a cell, carving a passage into every unvisited cell entered,
+    until visit_count more cells have been visited.
+    :param grid: Grid to carve.
+    :param visited: One byte per cell index, 1 if visited. Updated in place.
+    :param current: Index of the cell to start from.
+    :param visit_count: Number of cells to visit before stopping.
+    :param steps: Random step slots, see iter_random_steps.
+    :return: Index of the cell the walk stopped on.
+    """
+    if visit_count <= 0:
+        return current
+
+    step_bases = get_step_bases(grid.rows, grid.cols)
+    offsets, directions = get_step_table(grid.cols)
+
+    for step in steps:
+        k = step_bases[current] + step
+        neighbour = current + offsets[k]
+
+        if not visited[neighbour]:
+            visited[neighbour] = 1
+            grid.set_visited(neighbour)
+            grid.remove_grid_wall(*divmod(current, grid.cols), directions[k])
+            visit_count -= 1
+            if not visit_count:
+                return neighbour
+
+        current = neighbour
+
+    return current
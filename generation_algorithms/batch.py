@@ -0,0 +1,73 @@
+"""
+Generate many mazes at once on a process pool.
+Maze i of a batch is generated from seed base_seed + i, so a batch can be rerun,
+or a single maze of it regenerated, with identical results.
+"""
+
+import random
+from collections.abc import Iterator
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
+
+from components.grid import Grid
+from generation_algorithms.registry import get_generator
+
+
+def generate_seeded_maze(
+    algorithm: str, grid_rows: int, grid_cols: int, seed: int
+) -> Grid:
+    """
+    Generate one maze deterministically from a seed.
+    :param algorithm: Name of the algorithm, see GENERATORS.
+    """
+    generate = get_generator(algorithm)
+    return generate(grid_rows, grid_cols, rng=random.Random(seed))
+
+
+def generate_mazes(
+    algorithm: str,
+    grid_rows: int,
+    grid_cols: int,
+    count: int,
+    base_seed: int,
+    max_workers: int | None = None,
+    chunksize: int = 1,
+) -> Iterator[Grid]:
+    """
+    Generate count mazes on a process pool and yield them in seed order.
+    Mazes are yielded as soon as they and all mazes before them are done.
+    :param algorithm: Name of the algorithm, see GENERATORS.
+    :param count: Number of mazes to generate.
+    :param base_seed: Seed of the first maze; maze i uses base_seed + i.
+    :param max_workers: Number of worker processes, defaults to the number of CPUs.
+    :param chunksize: Number of mazes sent to a worker at once. Raise it for small mazes.
+    """
+    # Checked here rather than in the generator function, so that errors are raised
+    # by the call itself and not on the first next()
+    get_generator(algorithm)
+    if count < 0:
+        raise ValueError("The number of mazes must not be negative")
+
+    return _iter_mazes(
+        algorithm, grid_rows, grid_cols, count, base_seed, max_workers, chunksize
+    )
+
+
+def _iter_mazes(
+    algorithm: str,
+    grid_rows: int,
+    grid_cols: int,
+    count: int,
+    base_seed: int,
+    max_workers: int | None,
+    chunksize: int,
+) -> Iterator[Grid]:
+    with ProcessPoolExecutor(max_workers) as executor:
+        yield from executor.map(
+            generate_seeded_maze,
+            repeat(algorithm, count),
+            repeat(grid_rows, count),
+            repeat(grid_cols, count),
+            range(base_seed, base_seed + count),
+            chunksize=chunksize,
+        )
@@ -0,0 +1,139 @@
+"""
+Cache of generated mazes keyed by (algorithm, rows, cols, seed).
+A maze is fully determined by its key (see generate_seeded_maze), so a cached maze can be
+served instead of generating it again. Recently used mazes are kept in memory, up to a
+number of bytes, and every generated maze can also be kept on disk as a binary maze file.
+"""
+
+import os
+from collections import OrderedDict
+from dataclasses import dataclass
+
+from components.grid import Grid
+from generation_algorithms.batch import generate_seeded_maze
+from generation_algorithms.registry import get_generator
+from utils.maze_file import read_maze, write_maze
+
+MazeKey = tuple[str, int, int, int]
+
+
+@dataclass
+class CacheStats:
+    hits: int = 0  # found in memory
+    disk_hits: int = 0  # found on disk
+    misses: int = 0  # generated
+    evictions: int = 0  # dropped from memory
+
+
+class MazeCache:
+    """
+    Two-tier LRU cache of mazes.
+    Mazes handed out by the cache are shared: treat them as read-only.
+    """
+
+    def __init__(self, max_bytes: int = 64 << 20, directory: str | None = None):
+        """
+        :param max_bytes: Limit of the estimated size of the mazes kept in memory.
+        :param directory: Directory of the disk tier, none if None. The disk tier is not
+                          bounded; the files can be deleted at any time.
+        """
+        self.max_bytes: int = max_bytes
+        self.directory: str | None = directory
+        self.stats: CacheStats = CacheStats()
+        self.size: int = 0  # estimated bytes of the mazes in memory
+        self._mazes: OrderedDict[MazeKey, Grid] = OrderedDict()
+
+        if directory is not None:
+            os.makedirs(directory, exist_ok=True)
+
+    def __len__(self) -> int:
+        return len(self._mazes)
+
+    def __contains__(self, key: MazeKey) -> bool:
+        return key in self._mazes
+
+    def get(self, key: MazeKey) -> Grid | None:
+        """
+        Get a maze from memory, else from disk, without generating it.
+        """
+        grid = self._mazes.get(key)
+        if grid is not None:
+            self._mazes.move_to_end(key)
+            self.stats.hits += 1
+            return grid
+
+        path = self._get_path(key)
+        if path is not None and os.path.exists(path):
+            grid = read_maze(path)
+            self.stats.disk_hits += 1
+            self._keep(key, grid)
+            return grid
+
+        return None
+
+    def put(self, key: MazeKey, grid: Grid) -> None:
+        """
+        Keep a maze in memory and, with a disk tier, on disk.
+        """
+        path = self._get_path(key)
+        if path is not None:
+            # Write to a temporary file first, so a half-written file is never read
+            temporary_path = f"{path}.{os.getpid()}.tmp"
+            with open(temporary_path, "wb") as file:
+                write_maze(file, grid, seed=key[3], algorithm=key[0])
+            os.replace(temporary_path, path)
+        self._keep(key, grid)
+
+    def get_or_generate(
+        self, algorithm: str, grid_rows: int, grid_cols: int, seed: int
+    ) -> Grid:
+        """
+        Get a maze from the cache, generating and caching it on a miss.
+        :param algorithm: Name of the algorithm, see GENERATORS.
+        """
+        get_generator(algorithm)  # unknown algorithms are not counted as misses
+        key = (algorithm, grid_rows, grid_cols, seed)
+
+        grid = self.get(key)
+        if grid is None:
+            self.stats.misses += 1
+            grid = generate_seeded_maze(algorithm, grid_rows, grid_cols, seed)
+            self.put(key, grid)
+        return grid
+
+    def clear(self) -> None:
+        """
+        Drop the mazes kept in memory; the disk tier is kept.
+        """
+        self._mazes.clear()
+        self.size = 0
+
+    def _keep(self, key: MazeKey, grid: Grid) -> None:
+        if key in self._mazes:
+            self.size -= get_maze_size(self._mazes.pop(key))
+
+        grid_size = get_maze_size(grid)
+        if grid_size > self.max_bytes:
+            return  # would evict everything else
+
+        self._mazes[key] = grid
+        self.size += grid_size
+        while self.size > self.max_bytes:
+            _, evicted = self._mazes.popitem(last=False)
+            self.size -= get_maze_size(evicted)
+            self.stats.evictions += 1
+
+    def _get_path(self, key: MazeKey) -> str | None:
+        if self.directory is None:
+            return None
+        algorithm, grid_rows, grid_cols, seed = key
+        return os.path.join(
+            self.directory, f"{algorithm}-{grid_rows}x{grid_cols}-{seed}.maze"
+        )
+
+
+def get_maze_size(grid: Grid) -> int:
+    """
+    Estimate the bytes taken by the arrays of a maze.
+    """
+    return len(grid.walls) + len(grid.visited) + 64 * len(grid.contents)
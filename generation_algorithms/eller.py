@@ -0,0 +1,168 @@
+# Eller: https://weblog.jamisbuck.org/2010/12/29/maze-generation-eller-s-algorithm
+
+import random
+from collections.abc import Iterator
+from typing import BinaryIO, TextIO
+
+from components.grid import Grid
+from components.renderer import render_row
+from enums.direction_enums import ALL_WALLS, WALL_BITS, QuadDirection
+from utils.maze_file import MazeHeader, write_maze_rows
+
+NORTH_BIT: int = WALL_BITS[QuadDirection.NORTH]
+SOUTH_BIT: int = WALL_BITS[QuadDirection.SOUTH]
+EAST_BIT: int = WALL_BITS[QuadDirection.EAST]
+WEST_BIT: int = WALL_BITS[QuadDirection.WEST]
+
+
+def iter_eller_rows(
+    grid_rows: int | None, grid_cols: int, rng: random.Random | None = None
+) -> Iterator[bytearray]:
+    """
+    Generate a maze with Eller's algorithm and yield the wall masks of each row, top to bottom.
+    Only the set labels of the current row are kept, so memory is O(cols) whatever the
+    number of rows. The outer border of the maze is left closed.
+    :param grid_rows: Number of rows of the maze, or None for an endless maze.
+    :param grid_cols: Number of columns of the maze.
+    :param rng: Source of the random draws, unseeded by default.
+    """
+    rng = rng if rng is not None else random.Random()
+    labels = list(range(grid_cols))  # set of each cell of the current row
+    next_label = grid_cols
+    open_north = 0  # bit c is set if cell c of the current row has no north wall
+
+    row = 0
+    while grid_rows is None or row < grid_rows:
+        is_last_row = grid_rows is not None and row == grid_rows - 1
+        masks = bytearray([ALL_WALLS]) * grid_cols
+        for col in range(grid_cols):
+            if open_north >> col & 1:
+                masks[col] &= ~NORTH_BIT
+
+        members: dict[int, list[int]] = {}
+        for col, label in enumerate(labels):
+            members.setdefault(label, []).append(col)
+
+        # Randomly join adjacent cells of different sets; the last row joins them all
+        join_bits = rng.getrandbits(grid_cols)
+        for col in range(grid_cols - 1):
+            kept, merged = labels[col], labels[col + 1]
+            if kept == merged or not (is_last_row or join_bits >> col & 1):
+                continue
+            masks[col] &= ~EAST_BIT
+            masks[col + 1] &= ~WEST_BIT
+            if len(members[kept]) < len(members[merged]):
+                kept, merged = merged, kept
+            for merged_col in members[merged]:
+                labels[merged_col] = kept
+            members[kept].extend(members.pop(merged))
+
+        if not is_last_row:
+            # Every set continues down through at least one cell; the other cells
+            # of the next row start new sets
+            down_bits = rng.getrandbits(grid_cols)
+            open_north = 0
+            for cols_of_set in members.values():
+                down = [col for col in cols_of_set if down_bits >> col & 1]
+                if not down:
+                    down = [rng.choice(cols_of_set)]
+                for col in down:
+                    open_north |= 1 << col
+                    masks[col] &= ~SOUTH_BIT
+
+            for col in range(grid_cols):
+                if not open_north >> col & 1:
+                    labels[col] = next_label
+                    next_label += 1
+
+        yield masks
+        row += 1
+
+
+def generate_eller_maze(
+    grid_rows: int,
+    grid_cols: int,
+    rng: random.Random | None = None,
+    directory: str | None = None,
+) -> Grid:
+    """
+    :param directory: Keep the grid in memory-mapped files of this directory, see Grid.
+                      The grid is filled row by row, which suits the page cache.
+    """
+    grid = Grid(grid_rows, grid_cols, rng, directory)
+    start_char = "X"
+
+    for row, masks in enumerate(iter_eller_rows(grid_rows, grid_cols, grid.rng)):
+        for col, mask in enumerate(masks):
+            if not mask & EAST_BIT:
+                grid.remove_grid_wall(row, col, QuadDirection.EAST)
+            if not mask & SOUTH_BIT:
+                grid.remove_grid_wall(row, col, QuadDirection.SOUTH)
+    grid.set_all_visited()
+
+    start_cell = grid.get_random_border_cell()
+    grid.open_maze(start_cell)
+    grid.get_random_any_cell_except(start_cell).set_cell_content(start_char)
+    return grid
+
+
+def iter_eller_lines(
+    grid_rows: int | None, grid_cols: int, rng: random.Random | None = None
+) -> Iterator[str]:
+    """
+    Yield the rendered lines of an Eller's algorithm maze, top to bottom.
+    The maze is entered through the top row and, if it has an end, left through the bottom row.
+    :param grid_rows: Number of rows of the maze, or None for an endless maze.
+    :param grid_cols: Number of columns of the maze.
+    :param rng: Source of the random draws, unseeded by default.
+    """
+    rng = rng if rng is not None else random.Random()
+    for row, masks in enumerate(iter_eller_rows(grid_rows, grid_cols, rng)):
+        is_last_row = grid_rows is not None and row == grid_rows - 1
+        if row == 0:
+            masks[rng.randrange(grid_cols)] &= ~NORTH_BIT
+        if is_last_row:
+            masks[rng.randrange(grid_cols)] &= ~SOUTH_BIT
+        yield from render_row(masks, is_last_row=is_last_row)
+
+
+def write_eller_maze(
+    file: TextIO, grid_rows: int, grid_cols: int, rng: random.Random | None = None
+) -> None:
+    """
+    Stream an Eller's algorithm maze to a text file object as its rows are generated.
+    :param file: File object to write to, e.g. sys.stdout, an open file or a socket file.
+    """
+    file.writelines(line + "\n" for line in iter_eller_lines(grid_rows, grid_cols, rng))
+
+
+def write_eller_maze_file(
+    file: BinaryIO, grid_rows: int, grid_cols: int, seed: int | None = None
+) -> MazeHeader:
+    """
+    Generate an Eller's algorithm maze straight into a binary maze file (see utils.maze_file).
+    Rows are packed and written as they are generated, so memory is O(cols) and the maze
+    can be much larger than RAM. The maze is entered through the top row.
+    :param file: Binary file object to write to, e.g. an open file.
+    :param seed: Seed of the random draws, recorded in the header.
+    :return: The header of the file, with the entrance and goal positions.
+    """
+    rng = random.Random(seed)
+    size = grid_rows * grid_cols
+
+    entrance_col = rng.randrange(grid_cols)
+    goal_index = rng.randrange(size - 1) if size > 1 else 0
+    if size > 1 and goal_index >= entrance_col:
+        goal_index += 1  # any cell but the entrance
+
+    header = MazeHeader(
+        rows=grid_rows,
+        cols=grid_cols,
+        seed=seed,
+        algorithm="eller",
+        entrance=(0, entrance_col),
+        entrance_openings=NORTH_BIT,
+        goal=divmod(goal_index, grid_cols),
+    )
+    write_maze_rows(file, header, iter_eller_rows(grid_rows, grid_cols, rng))
+    return header
@@ -0,0 +1,46 @@
+# Randomized Kruskal: https://en.wikipedia.org/wiki/Maze_generation_algorithm#Iterative_randomized_Kruskal's_algorithm_(with_sets)
+
+import random
+from array import array
+
+from components.grid import Grid
+from enums.direction_enums import QuadDirection
+from utils.union_find import UnionFind
+
+
+def generate_kruskal_maze(
+    grid_rows: int, grid_cols: int, rng: random.Random | None = None
+) -> Grid:
+    """
+    Remove the inner walls in random order whenever they separate two unconnected cells.
+    The walls are shuffled once and the cells merged with an array-backed union-find,
+    so the cost is close to linear in the number of cells. The union-find then becomes
+    the connected regions of the grid.
+    """
+    grid = Grid(grid_rows, grid_cols, rng)
+    start_char = "X"
+    cols = grid.cols
+
+    # Inner wall of cell index i: 2 * i for its east wall, 2 * i + 1 for its south wall
+    walls = array("i", (2 * i for i in range(grid.size) if i % cols != cols - 1))
+    walls.extend(2 * i + 1 for i in range(grid.size - cols))
+    grid.rng.shuffle(walls)
+
+    regions = UnionFind(grid.size)
+    for wall in walls:
+        if regions.count == 1:
+            break
+        index, is_south = wall >> 1, wall & 1
+        neighbour = index + cols if is_south else index + 1
+        if regions.union(index, neighbour):
+            direction = QuadDirection.SOUTH if is_south else QuadDirection.EAST
+            grid.remove_grid_wall(*divmod(index, cols), direction)
+
+    grid.regions = regions
+    for index in range(grid.size):
+        grid.set_visited(index)
+
+    start_cell = grid.get_random_border_cell()
+    grid.open_maze(start_cell)
+    grid.get_random_any_cell_except(start_cell).set_cell_content(start_char)
+    return grid
@@ -0,0 +1,74 @@
+# Randomized depth-first search: https://en.wikipedia.org/wiki/Maze_generation_algorithm#Randomized_depth-first_search
+
+import random
+from array import array
+
+from components.grid import Grid
+from enums.direction_enums import ALL_WALLS
+from generation_algorithms.random_walk import (
+    STEP_SLOTS,
+    get_step_bases,
+    get_step_table,
+    iter_random_steps,
+)
+
+# Number of neighbours of each neighbour class, indexed by step base
+_NEIGHBOUR_COUNTS: dict[int, int] = {
+    neighbour_class * STEP_SLOTS: neighbour_class.bit_count()
+    for neighbour_class in range(ALL_WALLS + 1)
+}
+
+
+def generate_random_dfs_maze(
+    grid_rows: int, grid_cols: int, rng: random.Random | None = None
+) -> Grid:
+    """
+    Carve the maze with a depth-first search that picks a random unvisited neighbour
+    at every step and backtracks at dead ends.
+    The search uses an explicit stack of cell indices in an array, not recursion,
+    so it works for any grid that fits in memory.
+    """
+    grid = Grid(grid_rows, grid_cols, rng)
+    start_char = "X"
+    start_cell = grid.get_random_border_cell()
+    grid.open_maze(start_cell)
+
+    step_bases = get_step_bases(grid.rows, grid.cols)
+    offsets, directions = get_step_table(grid.cols)
+    steps = iter_random_steps(grid.rng)
+
+    visited = bytearray(grid.size)
+    start = start_cell.pos[0] * grid.cols + start_cell.pos[1]
+    visited[start] = 1
+    grid.set_visited(start)
+    stack = array("i", [start])
+    deepest, max_depth = start, 1
+
+    while stack:
+        current = stack[-1]
+        base = step_bases[current]
+        # The first slots of a neighbour class hold each of its neighbours once
+        unvisited = [
+            k
+            for k in range(base, base + _NEIGHBOUR_COUNTS[base])
+            if not visited[current + offsets[k]]
+        ]
+
+        if not unvisited:
+            stack.pop()  # dead end: backtrack
+            continue
+
+        # Slots are uniform in 0..11 and 1, 2, 3 and 4 all divide 12
+        k = unvisited[next(steps) % len(unvisited)]
+        neighbour = current + offsets[k]
+        visited[neighbour] = 1
+        grid.set_visited(neighbour)
+        grid.remove_grid_wall(*divmod(current, grid.cols), directions[k])
+        stack.append(neighbour)
+
+        if len(stack) > max_depth:
+            deepest, max_depth = neighbour, len(stack)
+
+    # The goal goes on the cell furthest from the start along the maze
+    grid.get_cell(*divmod(deepest, grid.cols)).set_cell_content(start_char)
+    return grid
@@ -0,0 +1,75 @@
+"""
+Tables and batched random draws shared by the random-walk generators.
+
+Every cell has a neighbour class: the mask of the directions in which it has a neighbour,
+using the same bits as WALL_BITS. The step table lists, for every class, its neighbours
+repeated over STEP_SLOTS slots. As 1, 2, 3 and 4 all divide STEP_SLOTS, a uniform slot
+0..STEP_SLOTS-1 picks a uniform neighbour whatever the number of neighbours of the cell.
+"""
+
+import random
+from collections.abc import Iterator
+
+from enums.direction_enums import ALL_WALLS, WALL_BITS, QuadDirection
+
+STEP_SLOTS: int = 12
+BATCH_SIZE: int = 1 << 16
+
+# Random bytes are mapped to slots; bytes above the largest multiple of STEP_SLOTS
+# are dropped so that every slot stays equally likely.
+_SLOT_OF_BYTE: bytes = bytes(b % STEP_SLOTS for b in range(256))
+_REJECTED_BYTES: bytes = bytes(range(256 - 256 % STEP_SLOTS, 256))
+
+
+def get_step_bases(rows: int, cols: int) -> bytearray:
+    """
+    Get, for every cell index, the position of its first slot in the step table:
+    neighbour class * STEP_SLOTS. Built row by row, so it costs one byte per cell.
+    """
+    north, south = WALL_BITS[QuadDirection.NORTH], WALL_BITS[QuadDirection.SOUTH]
+    east, west = WALL_BITS[QuadDirection.EAST], WALL_BITS[QuadDirection.WEST]
+
+    def row_bases(vertical: int) -> bytearray:
+        if cols == 1:
+            return bytearray([vertical * STEP_SLOTS])
+        first = bytearray([(vertical | east) * STEP_SLOTS])
+        middle = bytearray([(vertical | east | west) * STEP_SLOTS]) * (cols - 2)
+        last = bytearray([(vertical | west) * STEP_SLOTS])
+        return first + middle + last
+
+    if rows == 1:
+        return row_bases(0)
+    return row_bases(south) + row_bases(north | south) * (rows - 2) + row_bases(north)
+
+
+def get_step_table(cols: int) -> tuple[list[int], list[QuadDirection]]:
+    """
+    Get the step table of a grid with cols columns.
+    For a cell with step base b and slot s, the neighbour reached is at index offset
+    offsets[b + s] in direction directions[b + s].
+    :return: (offsets, directions), both of length 16 * STEP_SLOTS.
+    """
+    offsets: list[int] = []
+    directions: list[QuadDirection] = []
+
+    for neighbour_class in range(ALL_WALLS + 1):
+        present = [d for d, bit in WALL_BITS.items() if neighbour_class & bit]
+        # A cell without neighbours (the single cell of a 1x1 grid) is never walked from
+        slots = (
+            present * (STEP_SLOTS // len(present))
+            if present
+            else [QuadDirection.NORTH] * STEP_SLOTS
+        )
+        offsets.extend(d.value[0] * cols + d.value[1] for d in slots)
+        directions.extend(slots)
+
+    return offsets, directions
+
+
+def iter_random_steps(rng: random.Random) -> Iterator[int]:
+    """
+    Endlessly yield uniform slots in 0..STEP_SLOTS-1.
+    Slots are drawn BATCH_SIZE random bytes at a time and converted with bytes.translate.
+    """
+    while True:
+        yield from rng.randbytes(BATCH_SIZE).translate(_SLOT_OF_BYTE, _REJECTED_BYTES)
@@ -0,0 +1,41 @@
+import random
+from typing import Protocol
+
+from components.grid import Grid
+from generation_algorithms.aldous_broder import (
+    generate_aldous_broder_maze,
+    generate_aldous_broder_maze_fast,
+)
+from generation_algorithms.eller import generate_eller_maze
+from generation_algorithms.kruskal import generate_kruskal_maze
+from generation_algorithms.random_dfs import generate_random_dfs_maze
+from generation_algorithms.wilson import (
+    generate_aldous_broder_wilson_maze,
+    generate_wilson_maze,
+)
+
+
+class MazeGenerator(Protocol):
+    def __call__(
+        self, grid_rows: int, grid_cols: int, rng: random.Random | None = None
+    ) -> Grid: ...
+
+
+# Generators by algorithm name
+GENERATORS: dict[str, MazeGenerator] = {
+    "aldous_broder": generate_aldous_broder_maze,
+    "aldous_broder_fast": generate_aldous_broder_maze_fast,
+    "wilson": generate_wilson_maze,
+    "aldous_broder_wilson": generate_aldous_broder_wilson_maze,
+    "random_dfs": generate_random_dfs_maze,
+    "kruskal": generate_kruskal_maze,
+    "eller": generate_eller_maze,
+}
+
+
+def get_generator(algorithm: str) -> MazeGenerator:
+    if algorithm not in GENERATORS:
+        raise ValueError(
+            f"Unknown algorithm {algorithm!r}, expected one of {', '.join(GENERATORS)}"
+        )
+    return GENERATORS[algorithm]
@@ -0,0 +1,141 @@
+"""
+Generate a large maze as independent tiles on a process pool.
+Each tile is a perfect maze made by an existing generator. The tiles are then joined
+by carving one passage across the boundary of every pair of tiles adjacent in a random
+spanning tree over the tiles, so the whole maze is still connected and without loops.
+"""
+
+import random
+from concurrent.futures import ProcessPoolExecutor
+
+from components.grid import Grid
+from enums.direction_enums import WALL_BITS, QuadDirection
+from generation_algorithms.random_dfs import generate_random_dfs_maze
+from generation_algorithms.registry import MazeGenerator
+from utils.union_find import UnionFind
+
+NORTH_BIT: int = WALL_BITS[QuadDirection.NORTH]
+SOUTH_BIT: int = WALL_BITS[QuadDirection.SOUTH]
+EAST_BIT: int = WALL_BITS[QuadDirection.EAST]
+WEST_BIT: int = WALL_BITS[QuadDirection.WEST]
+
+
+def generate_tiled_maze(
+    grid_rows: int,
+    grid_cols: int,
+    tile_rows: int = 256,
+    tile_cols: int = 256,
+    generate: MazeGenerator = generate_random_dfs_maze,
+    max_workers: int | None = None,
+    rng: random.Random | None = None,
+) -> Grid:
+    """
+    :param tile_rows: Number of rows of a tile. Tiles on the bottom edge may be shorter.
+    :param tile_cols: Number of columns of a tile. Tiles on the right edge may be narrower.
+    :param generate: Module-level generator used for every tile, e.g. generate_wilson_maze.
+    :param max_workers: Number of worker processes, defaults to the number of CPUs.
+    :param rng: Source of the random draws; every tile gets its own seed drawn from it.
+    """
+    if tile_rows < 1 or tile_cols < 1:
+        raise ValueError("The tile dimensions must be at least 1")
+
+    grid = Grid(grid_rows, grid_cols, rng)
+    start_char = "X"
+
+    tiles = [
+        (row, col, min(tile_rows, grid_rows - row), min(tile_cols, grid_cols - col))
+        for row in range(0, grid_rows, tile_rows)
+        for col in range(0, grid_cols, tile_cols)
+    ]
+    tile_args = (
+        (generate, rows, cols, grid.rng.getrandbits(64)) for _, _, rows, cols in tiles
+    )
+
+    if len(tiles) == 1:
+        tile_walls = [_generate_tile(*next(tile_args))]
+    else:
+        with ProcessPoolExecutor(max_workers) as executor:
+            tile_walls = list(executor.map(_generate_tile, *zip(*tile_args)))
+
+    # Every tile is connected, so its cells form one region; the joins then merge them
+    regions = UnionFind(grid.size)
+    for (row, col, rows, cols), walls in zip(tiles, tile_walls):
+        root = row * grid_cols + col
+        for r in range(rows):
+            start = (row + r) * grid_cols + col
+            grid.walls[start : start + cols] = walls[r * cols : (r + 1) * cols]
+            regions.merge_singletons(root, range(start, start + cols))
+    grid.regions = regions
+    grid.set_all_visited()
+
+    _join_tiles(grid, tile_rows, tile_cols)
+
+    start_cell = grid.get_random_border_cell()
+    grid.open_maze(start_cell)
+    grid.get_random_any_cell_except(start_cell).set_cell_content(start_char)
+    return grid
+
+
+def _generate_tile(generate: MazeGenerator, rows: int, cols: int, seed: int) -> bytes:
+    """
+    Generate one tile in a worker process.
+    :return: Wall masks of the tile with its outer border closed.
+    """
+    walls = generate(rows, cols, rng=random.Random(seed)).walls
+
+    # Close the entrance opened by the generator; tiles are joined afterwards
+    for col in range(cols):
+        walls[col] |= NORTH_BIT
+        walls[(rows - 1) * cols + col] |= SOUTH_BIT
+    for row in range(rows):
+        walls[row * cols] |= WEST_BIT
+        walls[row * cols + cols - 1] |= EAST_BIT
+
+    return bytes(walls)
+
+
+def _join_tiles(grid: Grid, tile_rows: int, tile_cols: int) -> None:
+    """
+    Carve one passage between the tiles of each edge of a random spanning tree of the tiles.
+    The tree is grown with a randomized depth-first search over the tiles.
+    """
+    tiles_down = -(-grid.rows // tile_rows)
+    tiles_across = -(-grid.cols // tile_cols)
+
+    visited = {(0, 0)}
+    stack = [(0, 0)]
+    while stack:
+        tile_row, tile_col = stack[-1]
+        unvisited = []
+        for direction in QuadDirection:
+            dr, dc = direction.value
+            neighbour = (tile_row + dr, tile_col + dc)
+            if (
+                0 <= neighbour[0] < tiles_down
+                and 0 <= neighbour[1] < tiles_across
+                and neighbour not in visited
+            ):
+                unvisited.append((direction, neighbour))
+
+        if not unvisited:
+            stack.pop()
+            continue
+
+        direction, neighbour = grid.rng.choice(unvisited)
+        visited.add(neighbour)
+        stack.append(neighbour)
+
+        # Pick a random cell of the current tile along the shared boundary
+        first_row = tile_row * tile_rows
+        first_col = tile_col * tile_cols
+        last_row = min(first_row + tile_rows, grid.rows) - 1
+        last_col = min(first_col + tile_cols, grid.cols) - 1
+        if direction == QuadDirection.NORTH:
+            row, col = first_row, grid.rng.randint(first_col, last_col)
+        elif direction == QuadDirection.SOUTH:
+            row, col = last_row, grid.rng.randint(first_col, last_col)
+        elif direction == QuadDirection.EAST:
+            row, col = grid.rng.randint(first_row, last_row), last_col
+        else:
+            row, col = grid.rng.randint(first_row, last_row), first_col
+        grid.remove_grid_wall(row, col, direction)
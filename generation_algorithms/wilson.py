@@ -0,0 +1,112 @@
+# Wilson: https://en.wikipedia.org/wiki/Loop-erased_random_walk#Uniform_spanning_tree
+
+import math
+import random
+from collections.abc import Iterator
+
+from components.grid import Grid
+from generation_algorithms.aldous_broder import walk_aldous_broder
+from generation_algorithms.random_walk import (
+    get_step_bases,
+    get_step_table,
+    iter_random_steps,
+)
+
+
+def generate_wilson_maze(
+    grid_rows: int, grid_cols: int, rng: random.Random | None = None
+) -> Grid:
+    grid = Grid(grid_rows, grid_cols, rng)
+    start_char = "X"
+    start_cell = grid.get_random_border_cell()
+    grid.open_maze(start_cell)
+
+    in_tree = bytearray(grid.size)
+    root = start_cell.pos[0] * grid.cols + start_cell.pos[1]
+    in_tree[root] = 1
+    grid.set_visited(root)
+
+    last_walk_start = add_loop_erased_walks(grid, in_tree, iter_random_steps(grid.rng))
+
+    end = root if last_walk_start is None else last_walk_start
+    grid.get_cell(*divmod(end, grid.cols)).set_cell_content(start_char)
+    return grid
+
+
+def generate_aldous_broder_wilson_maze(
+    grid_rows: int,
+    grid_cols: int,
+    switch_fraction: float = 0.5,
+    rng: random.Random | None = None,
+) -> Grid:
+    """
+    Start with Aldous Broder, which is fast while most cells are unvisited,
+    then switch to Wilson, which is fast once most cells are in the tree.
+    Both steps keep the uniform spanning tree distribution.
+    :param switch_fraction: Fraction of visited cells at which to switch to Wilson.
+    """
+    if not 0 <= switch_fraction <= 1:
+        raise ValueError("The switch fraction must be between 0 and 1")
+
+    grid = Grid(grid_rows, grid_cols, rng)
+    start_char = "X"
+    start_cell = grid.get_random_border_cell()
+    grid.open_maze(start_cell)
+
+    in_tree = bytearray(grid.size)
+    current = start_cell.pos[0] * grid.cols + start_cell.pos[1]
+    in_tree[current] = 1
+    grid.set_visited(current)
+
+    steps = iter_random_steps(grid.rng)
+    switch_count = max(1, math.ceil(switch_fraction * grid.size))
+    current = walk_aldous_broder(grid, in_tree, current, switch_count - 1, steps)
+    last_walk_start = add_loop_erased_walks(grid, in_tree, steps)
+
+    end = current if last_walk_start is None else last_walk_start
+    grid.get_cell(*divmod(end, grid.cols)).set_cell_content(start_char)
+    return grid
+
+
+def add_loop_erased_walks(
+    grid: Grid, in_tree: bytearray, steps: Iterator[int]
+) -> int | None:
+    """
+    Add every cell not yet in the tree with a loop-erased random walk that ends on the tree.
+    :param grid: Grid to carve.
+    :param in_tree: One byte per cell index, 1 if the cell is in the tree. Updated in place.
+    :param steps: Random step slots, see iter_random_steps.
+    :return: Index of the cell the last walk started from, or None if there were no walks.
+    """
+    step_bases = get_step_bases(grid.rows, grid.cols)
+    offsets, directions = get_step_table(grid.cols)
+    # Step table position of the last exit taken from each cell of the current walk
+    exits = bytearray(grid.size)
+    last_walk_start = None
+
+    for start in range(grid.size):
+        if in_tree[start]:
+            continue
+
+        # Walk until the tree is hit. Leaving a cell again overwrites its exit,
+        # which erases the loop made since the previous visit.
+        current = start
+        for step in steps:
+            k = step_bases[current] + step
+            exits[current] = k
+            current += offsets[k]
+            if in_tree[current]:
+                break
+
+        # Follow the loop-erased path and add it to the tree
+        current = start
+        while not in_tree[current]:
+            k = exits[current]
+            in_tree[current] = 1
+            grid.set_visited(current)
+            grid.remove_grid_wall(*divmod(current, grid.cols), directions[k])
+            current += offsets[k]
+
+        last_walk_start = start
+
+    return last_walk_start
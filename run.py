@@ -37,4 +37,4 @@ if __name__ == "__main__":
             break
         print("❌ Invalid input. Enter a positive integer.")
 
-    print(generate_aldous_broder_maze(rows, cols))
+    generate_aldous_broder_maze(rows, cols).write_to(sys.stdout)
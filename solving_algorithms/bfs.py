@@ -0,0 +1,167 @@
+# Breadth-first search: https://en.wikipedia.org/wiki/Breadth-first_search
+
+from array import array
+
+from components.grid import Grid
+from enums.direction_enums import ALL_WALLS, WALL_BITS, QuadDirection
+
+NORTH_BIT: int = WALL_BITS[QuadDirection.NORTH]
+SOUTH_BIT: int = WALL_BITS[QuadDirection.SOUTH]
+EAST_BIT: int = WALL_BITS[QuadDirection.EAST]
+WEST_BIT: int = WALL_BITS[QuadDirection.WEST]
+
+# Bytes translation tables adding a wall to every mask
+_WITH_WALL: dict[int, bytes] = {
+    bit: bytes(mask | bit for mask in range(256))
+    for bit in (NORTH_BIT, SOUTH_BIT, EAST_BIT, WEST_BIT)
+}
+
+
+def seal_walls(grid: Grid) -> bytearray:
+    """
+    Copy the wall masks of a grid with the outer walls closed, e.g. over the opened entrance.
+    Moves allowed by the copy never leave the grid, so no bounds checks are needed on it.
+    """
+    rows, cols = grid.rows, grid.cols
+    sealed = bytearray(grid.walls)
+    sealed[:cols] = sealed[:cols].translate(_WITH_WALL[NORTH_BIT])
+    sealed[(rows - 1) * cols :] = sealed[(rows - 1) * cols :].translate(
+        _WITH_WALL[SOUTH_BIT]
+    )
+    sealed[::cols] = sealed[::cols].translate(_WITH_WALL[WEST_BIT])
+    sealed[cols - 1 :: cols] = sealed[cols - 1 :: cols].translate(_WITH_WALL[EAST_BIT])
+    return sealed
+
+
+def get_open_offsets(cols: int) -> list[tuple[int, ...]]:
+    """
+    Get the index offsets of the open neighbours of a cell for every wall mask.
+    """
+    offsets = {NORTH_BIT: -cols, SOUTH_BIT: cols, EAST_BIT: 1, WEST_BIT: -1}
+    return [
+        tuple(offset for bit, offset in offsets.items() if not mask & bit)
+        for mask in range(ALL_WALLS + 1)
+    ]
+
+
+def find_entrance(grid: Grid) -> tuple[int, int] | None:
+    """
+    Find the border cell opened by Grid.open_maze.
+    """
+    rows, cols = grid.rows, grid.cols
+    borders = [
+        (range(cols), NORTH_BIT),
+        (range((rows - 1) * cols, rows * cols), SOUTH_BIT),
+        (range(0, rows * cols, cols), WEST_BIT),
+        (range(cols - 1, rows * cols, cols), EAST_BIT),
+    ]
+    for indices, bit in borders:
+        for index in indices:
+            if not grid.walls[index] & bit:
+                return divmod(index, cols)
+    return None
+
+
+def find_content(grid: Grid, content: str) -> tuple[int, int] | None:
+    """
+    Find the first cell holding the given content, e.g. the "X" goal.
+    """
+    indices = [index for index, char in grid.contents.items() if char == content]
+    return divmod(min(indices), grid.cols) if indices else None
+
+
+def fill_depths(
+    sealed: bytearray,
+    open_offsets: list[tuple[int, ...]],
+    depths: "array[int]",
+    start_index: int,
+    goal_index: int = -1,
+) -> int:
+    """
+    Breadth-first search from a cell, writing the distance + 1 of every reached cell.
+    The search goes one distance level at a time: the whole frontier is expanded through
+    the open offsets of each wall mask, so no per-cell objects are created.
+    Each reached cell still costs a few bytecodes, about 0.2 µs in CPython, so a full
+    search of a 2000 x 2000 maze takes about 0.8 s. Whole-grid operations per level do not
+    help here: a perfect maze has thousands of levels with a few cells each.
+    :param sealed: Wall masks with closed outer walls, see seal_walls.
+    :param open_offsets: See get_open_offsets.
+    :param depths: Zeroed int buffer with one item per cell; 0 stays for unreached cells.
+    :param goal_index: Cell after whose level the search stops; the whole maze by default.
+    :return: The index of a cell reached last, i.e. one of the furthest from the start.
+    """
+    depth = depths[start_index] = 1
+    frontier = [start_index]
+    last_index = start_index
+
+    while frontier and (goal_index < 0 or not depths[goal_index]):
+        last_index = frontier[-1]
+        depth += 1
+        next_frontier: list[int] = []
+        append = next_frontier.append
+        for index in frontier:
+            for offset in open_offsets[sealed[index]]:
+                neighbour = index + offset
+                if not depths[neighbour]:
+                    depths[neighbour] = depth
+                    append(neighbour)
+        frontier = next_frontier
+
+    return frontier[-1] if frontier else last_index
+
+
+def walk_back(
+    sealed: bytearray,
+    open_offsets: list[tuple[int, ...]],
+    depths: "array[int]",
+    index: int,
+) -> list[int]:
+    """
+    Walk from a cell filled by fill_depths back to the start, one level down per move.
+    :return: The cell indices of the path from the start to the given cell.
+    """
+    path = [index]
+    while depths[index] > 1:
+        previous_depth = depths[index] - 1
+        for offset in open_offsets[sealed[index]]:
+            if depths[index + offset] == previous_depth:
+                index += offset
+                break
+        path.append(index)
+    path.reverse()
+    return path
+
+
+def get_shortest_path(
+    grid: Grid, start: tuple[int, int], goal: tuple[int, int]
+) -> tuple[list[tuple[int, int]], int] | None:
+    """
+    Find a shortest path between two cells with a breadth-first search over the wall masks.
+    :param start: (row, column) of the cell to start from, e.g. the entrance.
+    :param goal: (row, column) of the cell to reach, e.g. the cell marked "X".
+    :return: The cells of the path from start to goal and its length in moves,
+             or None if the goal cannot be reached.
+    """
+    cols = grid.cols
+    goal_index = goal[0] * cols + goal[1]
+    sealed = seal_walls(grid)
+    open_offsets = get_open_offsets(cols)
+    depths = array("i", [0]) * grid.size
+
+    fill_depths(sealed, open_offsets, depths, start[0] * cols + start[1], goal_index)
+    if not depths[goal_index]:
+        return None
+
+    path = walk_back(sealed, open_offsets, depths, goal_index)
+    return [divmod(index, cols) for index in path], len(path) - 1
+
+
+def solve_maze(grid: Grid) -> tuple[list[tuple[int, int]], int] | None:
+    """
+    Find the shortest path from the entrance of a maze to the cell marked "X".
+    :return: See get_shortest_path. None if the maze has no entrance or goal.
+    """
+    entrance, goal = find_entrance(grid), find_content(grid, "X")
+    if entrance is None or goal is None:
+        return None
+    return get_shortest_path(grid, entrance, goal)
@@ -0,0 +1,87 @@
+"""
+The two furthest points of a maze.
+In a perfect maze the cell furthest from any cell is an end of a longest path, so the
+diameter takes two breadth-first searches; the buffers of the searches are reused.
+In a maze with loops the result is a longest shortest path from such a cell, which may be
+shorter than the diameter.
+"""
+
+from array import array
+
+from components.grid import Grid
+from solving_algorithms.bfs import fill_depths, get_open_offsets, seal_walls
+
+
+def get_diameter(grid: Grid) -> tuple[tuple[int, int], tuple[int, int], int]:
+    """
+    Find the two ends of a longest path of a maze.
+    :return: The (row, column) of both ends and the number of moves between them.
+    """
+    sealed = seal_walls(grid)
+    open_offsets = get_open_offsets(grid.cols)
+    depths = array("i", [0]) * grid.size
+
+    first_end = fill_depths(sealed, open_offsets, depths, 0)
+    depths[:] = array("i", [0]) * grid.size  # buffer reuse
+    second_end = fill_depths(sealed, open_offsets, depths, first_end)
+
+    return (
+        divmod(first_end, grid.cols),
+        divmod(second_end, grid.cols),
+        depths[second_end] - 1,
+    )
+
+
+def get_border_diameter(grid: Grid) -> tuple[tuple[int, int], tuple[int, int], int]:
+    """
+    Find a longest path of a maze that starts on the border, i.e. that can be entered.
+    The cell furthest from a border cell is an end of the diameter, so a third search,
+    from the other end, gives the distance of every border cell to both ends.
+    :return: The (row, column) of the border end, of the other end and the number of moves
+             between them.
+    """
+    cols = grid.cols
+    sealed = seal_walls(grid)
+    open_offsets = get_open_offsets(cols)
+    first_depths = array("i", [0]) * grid.size
+    second_depths = array("i", [0]) * grid.size
+
+    first_end = fill_depths(sealed, open_offsets, first_depths, 0)
+    first_depths[:] = second_depths  # buffer reuse, still zeroed
+    second_end = fill_depths(sealed, open_offsets, first_depths, first_end)
+    fill_depths(sealed, open_offsets, second_depths, second_end)
+
+    border = [r * cols + c for r, c in grid.get_border_cells()]
+    from_first = max(border, key=first_depths.__getitem__)
+    from_second = max(border, key=second_depths.__getitem__)
+
+    if first_depths[from_first] >= second_depths[from_second]:
+        return (
+            divmod(from_first, cols),
+            divmod(first_end, cols),
+            first_depths[from_first] - 1,
+        )
+    return (
+        divmod(from_second, cols),
+        divmod(second_end, cols),
+        second_depths[from_second] - 1,
+    )
+
+
+def place_at_diameter(
+    grid: Grid, goal_char: str = "X"
+) -> tuple[tuple[int, int], tuple[int, int], int]:
+    """
+    Move the entrance and the goal of a maze to the ends of its longest enterable path,
+    so that the level is as hard as the maze allows.
+    Outer walls are closed again and the previous goal is removed first.
+    :return: See get_border_diameter.
+    """
+    grid.walls[:] = seal_walls(grid)
+    for index in [i for i, char in grid.contents.items() if char == goal_char]:
+        del grid.contents[index]
+
+    entrance, goal, distance = get_border_diameter(grid)
+    grid.open_maze(grid.get_cell(*entrance))
+    grid.get_cell(*goal).set_cell_content(goal_char)
+    return entrance, goal, distance
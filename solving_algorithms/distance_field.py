@@ -0,0 +1,54 @@
+"""
+Distances from every cell to a goal, for queries made on every move of a game.
+One breadth-first search from the goal fills an int array that is cached on the Grid,
+so a query is an array lookup until the walls of the maze change.
+"""
+
+from array import array
+
+from components.grid import Grid
+from solving_algorithms.bfs import fill_depths, get_open_offsets, seal_walls
+
+# Number of goals whose fields are kept per Grid; each field takes 4 bytes per cell
+MAX_DISTANCE_FIELDS: int = 4
+
+
+def get_distance_field(grid: Grid, goal: tuple[int, int]) -> "array[int]":
+    """
+    Get the distance + 1 of every cell to the goal, 0 for cells that cannot reach it.
+    It is computed on first use and cached on the grid; only the MAX_DISTANCE_FIELDS
+    most recently computed fields are kept.
+    """
+    goal_index = goal[0] * grid.cols + goal[1]
+    depths = grid.distance_fields.get(goal_index)
+
+    if depths is None:
+        depths = array("i", [0]) * grid.size
+        fill_depths(seal_walls(grid), get_open_offsets(grid.cols), depths, goal_index)
+        if len(grid.distance_fields) >= MAX_DISTANCE_FIELDS:
+            del grid.distance_fields[next(iter(grid.distance_fields))]
+        grid.distance_fields[goal_index] = depths
+
+    return depths
+
+
+def get_moves_remaining(
+    grid: Grid, cell: tuple[int, int], goal: tuple[int, int]
+) -> int:
+    """
+    Get the number of moves from a cell to the goal, -1 if the goal cannot be reached.
+    """
+    return get_distance_field(grid, goal)[cell[0] * grid.cols + cell[1]] - 1
+
+
+def is_wrong_turn(
+    grid: Grid, cell: tuple[int, int], next_cell: tuple[int, int], goal: tuple[int, int]
+) -> bool:
+    """
+    Check whether moving from a cell to a neighbour leads away from the goal.
+    """
+    depths = get_distance_field(grid, goal)
+    return (
+        depths[next_cell[0] * grid.cols + next_cell[1]]
+        > depths[cell[0] * grid.cols + cell[1]]
+    )
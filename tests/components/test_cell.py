@@ -8,7 +8,7 @@ from constants import (
     CELL_WIDTH,
     CELL_HEIGHT,
 )
-from enums.direction_enums import QuadDirection
+from enums.direction_enums import ALL_WALLS, WALL_BITS, QuadDirection
 
 
 @pytest.fixture
@@ -22,28 +22,28 @@ def test_tostr_all_walls(test_cell: Cell) -> None:
 
 
 def test_tostr_no_north_wall(test_cell: Cell) -> None:
-    test_cell.walls[QuadDirection.NORTH] = False
+    test_cell.walls &= ~WALL_BITS[QuadDirection.NORTH]
     assert str(test_cell) == "+   +\n│   │\n+---+"
 
 
 def test_tostr_no_south_wall(test_cell: Cell) -> None:
-    test_cell.walls[QuadDirection.SOUTH] = False
+    test_cell.walls &= ~WALL_BITS[QuadDirection.SOUTH]
     assert str(test_cell) == "+---+\n│   │\n+   +"
 
 
 def test_tostr_no_west_wall(test_cell: Cell) -> None:
-    test_cell.walls[QuadDirection.WEST] = False
+    test_cell.walls &= ~WALL_BITS[QuadDirection.WEST]
     assert str(test_cell) == "+---+\n    │\n+---+"
 
 
 def test_tostr_no_east_wall(test_cell: Cell) -> None:
-    test_cell.walls[QuadDirection.EAST] = False
+    test_cell.walls &= ~WALL_BITS[QuadDirection.EAST]
     assert str(test_cell) == "+---+\n│    \n+---+"
 
 
 def test_tostr_no_walls(test_cell: Cell) -> None:
     for direction in QuadDirection:
-        test_cell.walls[direction] = False
+        test_cell.walls &= ~WALL_BITS[direction]
     assert str(test_cell) == "+   +\n     \n+   +"
 
 
@@ -60,7 +60,7 @@ def test_get_cell_lines_structure(test_cell: Cell, monkeypatch: MonkeyPatch) ->
         QuadDirection.WEST: False,
     }
     content = "X"
-    test_cell.walls = walls
+    test_cell.walls = sum(WALL_BITS[d] for d, exists in walls.items() if exists)
     test_cell.set_cell_content(content)
 
     cell_lines = test_cell.get_cell_lines()
@@ -172,13 +172,22 @@ def test_tostr_remove_wall(test_cell: Cell) -> None:
 def test_remove_wall(test_cell: Cell) -> None:
     test_cell.remove_wall(QuadDirection.NORTH)
     test_cell.remove_wall(QuadDirection.WEST)
-    walls_dict = {
-        QuadDirection.NORTH: False,
-        QuadDirection.EAST: True,
-        QuadDirection.SOUTH: True,
-        QuadDirection.WEST: False,
-    }
-    assert test_cell.walls == walls_dict
+    assert test_cell.walls == (
+        WALL_BITS[QuadDirection.EAST] | WALL_BITS[QuadDirection.SOUTH]
+    )
+    assert not test_cell.has_wall(QuadDirection.NORTH)
+    assert not test_cell.has_wall(QuadDirection.WEST)
+    assert test_cell.has_wall(QuadDirection.EAST)
+    assert test_cell.has_wall(QuadDirection.SOUTH)
+
+
+def test_new_cell_has_all_walls(test_cell: Cell) -> None:
+    assert test_cell.walls == ALL_WALLS
+
+
+def test_cell_has_no_instance_dict(test_cell: Cell) -> None:
+    with pytest.raises(AttributeError):
+        test_cell.direction = QuadDirection  # type: ignore[attr-defined]
 
 
 # set_cell_content
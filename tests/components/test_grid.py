@@ -1,4 +1,5 @@
 import random
+from pathlib import Path
 
 from components.cell import Cell
 from components.grid import Grid
@@ -6,7 +7,8 @@ import pytest
 from pytest import MonkeyPatch
 from dataclasses import dataclass
 
-from enums.direction_enums import QuadDirection
+from enums.direction_enums import ALL_WALLS, WALL_BITS, QuadDirection
+from generation_algorithms.eller import generate_eller_maze
 
 
 @dataclass
@@ -301,3 +303,151 @@ def test_tostr_grid_bottom_left_corner_no_west(test_objects: TestObjects) -> Non
     )
 
     assert str(grid) == expected
+
+
+# Array-backed storage
+def test_grid_storage_sizes() -> None:
+    grid = Grid(5, 7)
+
+    assert len(grid.walls) == 35
+    assert len(grid.visited) == 5  # 35 bits
+    assert all(mask == ALL_WALLS for mask in grid.walls)
+
+
+def test_remove_grid_wall_updates_both_masks(test_objects: TestObjects) -> None:
+    grid = test_objects.grid
+    r, c = test_objects.middle_cell_pos
+
+    grid.remove_grid_wall(r, c, QuadDirection.EAST)
+
+    assert grid.walls[r * grid.cols + c] == ALL_WALLS & ~WALL_BITS[QuadDirection.EAST]
+    assert (
+        grid.walls[r * grid.cols + c + 1] == ALL_WALLS & ~WALL_BITS[QuadDirection.WEST]
+    )
+
+
+def test_cell_view_writes_through(test_objects: TestObjects) -> None:
+    grid = test_objects.grid
+    cell = grid.get_cell(*test_objects.middle_cell_pos)
+
+    cell.is_visited = True
+    cell.set_cell_content("X")
+
+    same_cell = grid.get_cell(*test_objects.middle_cell_pos)
+    assert same_cell.is_visited
+    assert same_cell.content == "X"
+    assert not grid.get_cell(0, 0).is_visited
+    assert "X" in str(grid)
+
+
+def test_get_accessible_neighbours(test_objects: TestObjects) -> None:
+    grid = test_objects.grid
+    r, c = test_objects.middle_cell_pos
+    grid.remove_grid_wall(r, c, QuadDirection.SOUTH)
+
+    accessible = grid.get_accessible_neighbours(grid.get_cell(r, c))
+
+    assert [(d, n.pos) for d, n in accessible] == [(QuadDirection.SOUTH, (2, 1))]
+
+
+def test_get_border_cells() -> None:
+    assert Grid(3, 3).get_border_cells() == [
+        (0, 0),
+        (0, 1),
+        (0, 2),
+        (1, 0),
+        (1, 2),
+        (2, 0),
+        (2, 1),
+        (2, 2),
+    ]
+    assert Grid(1, 3).get_border_cells() == [(0, 0), (0, 1), (0, 2)]
+
+
+def test_get_random_any_cell_except() -> None:
+    grid = Grid(1, 2)
+
+    for _ in range(20):
+        assert grid.get_random_any_cell_except(grid.get_cell(0, 0)).pos == (0, 1)
+    single_cell_grid = Grid(1, 1)
+    only_cell = single_cell_grid.get_cell(0, 0)
+    assert single_cell_grid.get_random_any_cell_except(only_cell).pos == (0, 0)
+
+
+# Connected regions
+def test_regions_follow_removed_walls() -> None:
+    grid = Grid(2, 2)
+    assert grid.count_regions() == 4
+
+    grid.remove_grid_wall(0, 0, QuadDirection.EAST)
+    grid.remove_grid_wall(1, 1, QuadDirection.NORTH)
+    grid.remove_grid_wall(0, 0, QuadDirection.NORTH)  # outer wall, joins nothing
+
+    assert grid.count_regions() == 2
+    assert grid.are_connected((0, 0), (1, 1))
+    assert not grid.are_connected((0, 0), (1, 0))
+    assert not grid.all_cells_accessible()
+
+    grid.remove_grid_wall(1, 0, QuadDirection.EAST)
+
+    assert grid.all_cells_accessible()
+
+
+def test_all_cells_accessible_has_no_side_effect() -> None:
+    grid = Grid(3, 3)
+
+    grid.all_cells_accessible()
+
+    assert not any(grid.visited)
+
+
+def test_regions_after_direct_writes() -> None:
+    grid = Grid(2, 3)
+    source = Grid(2, 3)
+    for c in range(2):
+        source.remove_grid_wall(0, c, QuadDirection.EAST)
+    source.remove_grid_wall(0, 2, QuadDirection.SOUTH)
+    assert grid.count_regions() == 6
+
+    grid.walls[:] = source.walls
+    grid.invalidate_regions()
+
+    assert grid.count_regions() == 3
+    assert grid.are_connected((0, 0), (1, 2))
+    assert not grid.are_connected((1, 0), (1, 1))
+
+
+def test_regions_follow_cell_view_edits() -> None:
+    grid = Grid(1, 3)
+    grid.remove_grid_wall(0, 0, QuadDirection.EAST)
+    assert not grid.all_cells_accessible()
+
+    grid.get_cell(0, 1).remove_wall(QuadDirection.EAST)
+    grid.get_cell(0, 2).remove_wall(QuadDirection.WEST)
+
+    assert grid.all_cells_accessible()
+
+
+def test_regions_are_built_on_first_query() -> None:
+    grid = Grid(3, 3)
+    grid.remove_grid_wall(0, 0, QuadDirection.SOUTH)
+    assert grid.regions is None
+
+    assert grid.count_regions() == 8
+    grid.remove_grid_wall(1, 0, QuadDirection.EAST)
+
+    assert grid.regions is not None and grid.regions.count == 7
+
+
+# Memory-mapped storage
+def test_mapped_grid_matches_in_memory_grid(tmp_path: Path) -> None:
+    grid = generate_eller_maze(12, 9, random.Random(3))
+
+    mapped = generate_eller_maze(12, 9, random.Random(3), directory=str(tmp_path))
+
+    assert mapped.walls[:] == grid.walls
+    assert mapped.visited[:] == grid.visited
+    assert mapped.contents == grid.contents
+    assert str(mapped) == str(grid)
+    assert mapped.all_cells_accessible()
+    assert not list(tmp_path.iterdir())  # the files are anonymous
@@ -0,0 +1,96 @@
+import io
+import random
+
+import pytest
+
+from components.grid import Grid
+from components.renderer import render_row
+from generation_algorithms.aldous_broder import generate_aldous_broder_maze
+
+
+def render_cell_by_cell(grid: Grid) -> str:
+    """
+    Reference rendering: merge Cell.get_cell_lines of every cell.
+    """
+    lines: list[str] = []
+    for r in range(grid.rows):
+        row_lines = [grid.get_cell(r, c).get_cell_lines() for c in range(grid.cols)]
+        if r < grid.rows - 1:
+            for lines_of_cell in row_lines:
+                lines_of_cell.pop()
+        for i in range(len(row_lines[0])):
+            merged_line = row_lines[0][i]
+            merged_line += "".join(cell_line[i][1:] for cell_line in row_lines[1:])
+            lines.append(merged_line)
+    return "\n".join(lines)
+
+
+@pytest.mark.parametrize("rows,cols", [(1, 1), (1, 6), (6, 1), (7, 9)])
+def test_tostr_matches_cell_rendering(rows: int, cols: int) -> None:
+    grid = generate_aldous_broder_maze(rows, cols, random.Random(rows * 100 + cols))
+    grid.get_random_any_cell().set_cell_content("o")
+
+    assert str(grid) == render_cell_by_cell(grid)
+
+
+def test_render_row_content() -> None:
+    grid = Grid(1, 3)
+    grid.get_cell(0, 1).set_cell_content("X")
+
+    assert render_row(grid.get_row_walls(0), grid.get_row_contents(0), True) == [
+        "+---+---+---+",
+        "│   │ X │   │",
+        "+---+---+---+",
+    ]
+
+
+def test_render_row_not_last_row_has_no_bottom_border() -> None:
+    grid = Grid(2, 2)
+
+    assert render_row(grid.get_row_walls(0)) == ["+---+---+", "│   │   │"]
+
+
+def test_render_row_taller_cells(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr("components.renderer.CELL_HEIGHT", 3)
+    grid = Grid(1, 2)
+    grid.get_cell(0, 0).set_cell_content("X")
+
+    assert render_row(grid.get_row_walls(0), grid.get_row_contents(0)) == [
+        "+---+---+",
+        "│ │ │",
+        "│ X │   │",
+        "│ │ │",
+    ]
+
+
+def test_iter_lines_matches_tostr() -> None:
+    grid = generate_aldous_broder_maze(5, 4, random.Random(4))
+
+    assert list(grid.iter_lines()) == str(grid).split("\n")
+
+
+@pytest.mark.parametrize("chunk_rows", [1, 2, 64])
+def test_write_to(chunk_rows: int) -> None:
+    grid = generate_aldous_broder_maze(5, 4, random.Random(5))
+    file = io.StringIO()
+
+    grid.write_to(file, chunk_rows)
+
+    assert file.getvalue() == str(grid) + "\n"
+
+
+def test_write_to_invalid_chunk_rows() -> None:
+    with pytest.raises(ValueError):
+        Grid(2, 2).write_to(io.StringIO(), 0)
+
+
+def test_iter_row_contents() -> None:
+    grid = Grid(3, 4)
+    grid.get_cell(2, 3).set_cell_content("X")
+    grid.get_cell(0, 1).set_cell_content("o")
+    grid.get_cell(2, 0).set_cell_content("o")
+
+    assert list(grid.iter_row_contents()) == [{1: "o"}, {}, {0: "o", 3: "X"}]
+    assert [grid.get_row_contents(r) for r in range(3)] == list(
+        grid.iter_row_contents()
+    )
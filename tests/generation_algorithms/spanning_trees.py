@@ -0,0 +1,31 @@
+import random
+from collections import Counter
+
+from enums.direction_enums import WALL_BITS, QuadDirection
+from generation_algorithms.registry import MazeGenerator
+
+
+def count_2x2_spanning_trees(
+    generate: MazeGenerator, runs: int, seed: int
+) -> Counter[tuple[bool, ...]]:
+    """
+    Generate 2x2 mazes and count how often each spanning tree comes out.
+    A 2x2 grid has 4 spanning trees: each leaves exactly one inner wall standing.
+    :return: Count of each (east walls of cells 0 and 2, south walls of cells 0 and 1).
+    """
+    rng = random.Random(seed)
+    east, south = WALL_BITS[QuadDirection.EAST], WALL_BITS[QuadDirection.SOUTH]
+    trees: Counter[tuple[bool, ...]] = Counter()
+
+    for _ in range(runs):
+        walls = generate(2, 2, rng=rng).walls
+        trees[
+            (
+                bool(walls[0] & east),
+                bool(walls[2] & east),
+                bool(walls[0] & south),
+                bool(walls[1] & south),
+            )
+        ] += 1
+
+    return trees
@@ -1,5 +1,10 @@
 import pytest
-from generation_algorithms.aldous_broder import generate_aldous_broder_maze
+
+from generation_algorithms.aldous_broder import (
+    generate_aldous_broder_maze,
+    generate_aldous_broder_maze_fast,
+)
+from tests.generation_algorithms.spanning_trees import count_2x2_spanning_trees
 
 
 @pytest.mark.parametrize(
@@ -16,4 +21,31 @@ def test_maze_accessibility(rows, cols):
     grid = generate_aldous_broder_maze(rows, cols)
 
     # Now test accessibility
-    assert grid.all_cells_accessible(), "Some cells are inaccessible!"
\ No newline at end of file
+    assert grid.all_cells_accessible(), "Some cells are inaccessible!"
+
+
+@pytest.mark.parametrize(
+    "rows,cols",
+    [
+        (1, 1),
+        (2, 2),
+        (5, 5),
+        (10, 10),
+        (1, 10),
+        (10, 1),
+        (30, 40),
+    ],
+)
+def test_fast_maze_accessibility(rows: int, cols: int) -> None:
+    grid = generate_aldous_broder_maze_fast(rows, cols)
+
+    assert grid.all_cells_accessible(), "Some cells are inaccessible!"
+    assert all(grid.is_visited(index) for index in range(grid.size))
+    assert list(grid.contents.values()) == ["X"]
+
+
+def test_fast_maze_is_uniform_spanning_tree() -> None:
+    trees = count_2x2_spanning_trees(generate_aldous_broder_maze_fast, 2000, seed=1)
+
+    assert len(trees) == 4
+    assert all(420 < count < 580 for count in trees.values())
@@ -0,0 +1,43 @@
+import pytest
+
+from generation_algorithms.batch import generate_mazes, generate_seeded_maze
+from generation_algorithms.registry import GENERATORS, get_generator
+
+
+def test_batch_reruns_match() -> None:
+    first = list(generate_mazes("kruskal", 6, 7, 5, base_seed=10, max_workers=2))
+    second = list(generate_mazes("kruskal", 6, 7, 5, base_seed=10, max_workers=2))
+
+    assert len(first) == 5
+    assert [g.walls for g in first] == [g.walls for g in second]
+    assert [g.contents for g in first] == [g.contents for g in second]
+    assert len({bytes(g.walls) for g in first}) == 5
+
+
+def test_batch_is_in_seed_order() -> None:
+    mazes = generate_mazes("wilson", 5, 5, 4, base_seed=3, max_workers=2)
+
+    for seed, grid in enumerate(mazes, start=3):
+        assert grid.walls == generate_seeded_maze("wilson", 5, 5, seed).walls
+
+
+@pytest.mark.parametrize("algorithm", list(GENERATORS))
+def test_every_algorithm_is_deterministic(algorithm: str) -> None:
+    first = generate_seeded_maze(algorithm, 6, 6, seed=1)
+    second = generate_seeded_maze(algorithm, 6, 6, seed=1)
+
+    assert first.all_cells_accessible()
+    assert first.walls == second.walls
+    assert first.contents == second.contents
+
+
+def test_unknown_algorithm() -> None:
+    with pytest.raises(ValueError):
+        get_generator("prim")
+    with pytest.raises(ValueError):
+        generate_mazes("prim", 2, 2, 1, base_seed=0)
+
+
+def test_negative_count() -> None:
+    with pytest.raises(ValueError):
+        generate_mazes("kruskal", 2, 2, -1, base_seed=0)
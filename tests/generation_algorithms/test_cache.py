@@ -0,0 +1,68 @@
+from pathlib import Path
+
+import pytest
+
+from generation_algorithms.batch import generate_seeded_maze
+from generation_algorithms.cache import MazeCache, get_maze_size
+from generation_algorithms.registry import GENERATORS
+
+
+@pytest.mark.parametrize("algorithm", list(GENERATORS))
+def test_get_or_generate(algorithm: str) -> None:
+    cache = MazeCache()
+
+    first = cache.get_or_generate(algorithm, 5, 6, seed=3)
+    second = cache.get_or_generate(algorithm, 5, 6, seed=3)
+
+    assert second is first
+    assert first.walls == generate_seeded_maze(algorithm, 5, 6, 3).walls
+    assert (cache.stats.hits, cache.stats.misses) == (1, 1)
+
+
+def test_lru_eviction() -> None:
+    maze_size = get_maze_size(generate_seeded_maze("kruskal", 10, 10, 0))
+    cache = MazeCache(max_bytes=2 * maze_size)
+
+    cache.get_or_generate("kruskal", 10, 10, 0)
+    cache.get_or_generate("kruskal", 10, 10, 1)
+    cache.get_or_generate("kruskal", 10, 10, 0)  # 0 is now the most recent
+    cache.get_or_generate("kruskal", 10, 10, 2)
+
+    assert ("kruskal", 10, 10, 0) in cache
+    assert ("kruskal", 10, 10, 1) not in cache
+    assert len(cache) == 2
+    assert cache.size == 2 * maze_size
+    assert (cache.stats.hits, cache.stats.misses, cache.stats.evictions) == (1, 3, 1)
+
+
+def test_maze_larger_than_the_cache_is_not_kept() -> None:
+    cache = MazeCache(max_bytes=10)
+
+    cache.get_or_generate("eller", 10, 10, 0)
+
+    assert len(cache) == 0 and cache.stats.evictions == 0
+
+
+def test_disk_tier(tmp_path: Path) -> None:
+    cache = MazeCache(directory=str(tmp_path))
+    generated = cache.get_or_generate("wilson", 8, 9, seed=-4)
+    assert len(list(tmp_path.iterdir())) == 1
+
+    cache.clear()
+    loaded = cache.get_or_generate("wilson", 8, 9, seed=-4)
+
+    assert loaded is not generated
+    assert loaded.walls == generated.walls
+    assert loaded.contents == generated.contents
+    assert (cache.stats.disk_hits, cache.stats.misses) == (1, 1)
+    # Another cache on the same directory shares the disk tier
+    other = MazeCache(directory=str(tmp_path))
+    assert other.get(("wilson", 8, 9, -4)) is not None
+
+
+def test_unknown_algorithm() -> None:
+    cache = MazeCache()
+
+    with pytest.raises(ValueError):
+        cache.get_or_generate("prim", 2, 2, 0)
+    assert cache.stats.misses == 0
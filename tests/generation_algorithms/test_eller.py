@@ -0,0 +1,106 @@
+import io
+from itertools import islice, pairwise
+from pathlib import Path
+
+import pytest
+
+from constants import CELL_HEIGHT
+from enums.direction_enums import WALL_BITS, QuadDirection
+from generation_algorithms.eller import (
+    generate_eller_maze,
+    iter_eller_rows,
+    write_eller_maze,
+    write_eller_maze_file,
+)
+from solving_algorithms.bfs import find_entrance, solve_maze
+from utils.maze_file import HEADER, MazeFile
+from utils.maze_validator import validate_maze
+
+
+def count_passages(rows: list[bytearray]) -> int:
+    east, south = WALL_BITS[QuadDirection.EAST], WALL_BITS[QuadDirection.SOUTH]
+    return sum(
+        (not mask & east) + (not mask & south) for masks in rows for mask in masks
+    )
+
+
+@pytest.mark.parametrize(
+    "rows,cols", [(1, 1), (2, 2), (5, 5), (10, 10), (1, 10), (10, 1), (30, 40)]
+)
+def test_maze_accessibility(rows: int, cols: int) -> None:
+    grid = generate_eller_maze(rows, cols)
+
+    assert grid.all_cells_accessible(), "Some cells are inaccessible!"
+    assert list(grid.contents.values()) == ["X"]
+    assert all(grid.is_visited(index) for index in range(grid.size))
+    assert grid.visited[-1] >> (grid.size - 1) % 8 + 1 == 0  # no padding bits
+
+
+def test_goal_is_not_the_entrance() -> None:
+    for _ in range(50):
+        grid = generate_eller_maze(2, 1)
+        goal = next(iter(grid.contents))
+        assert grid.walls[goal] & WALL_BITS[QuadDirection.WEST]
+
+
+@pytest.mark.parametrize("rows,cols", [(1, 1), (7, 3), (20, 20)])
+def test_rows_form_a_spanning_tree(rows: int, cols: int) -> None:
+    maze = list(iter_eller_rows(rows, cols))
+
+    assert len(maze) == rows
+    assert count_passages(maze) == rows * cols - 1
+
+
+def test_walls_are_consistent_between_rows() -> None:
+    north, south = WALL_BITS[QuadDirection.NORTH], WALL_BITS[QuadDirection.SOUTH]
+    maze = list(iter_eller_rows(12, 8))
+
+    for above, below in pairwise(maze):
+        assert [bool(m & south) for m in above] == [bool(m & north) for m in below]
+
+
+def test_endless_maze() -> None:
+    rows = list(islice(iter_eller_rows(None, 5), 1000))
+
+    assert len(rows) == 1000
+    assert all(len(masks) == 5 for masks in rows)
+
+
+def test_write_eller_maze() -> None:
+    file = io.StringIO()
+
+    write_eller_maze(file, 4, 6)
+
+    lines = file.getvalue().split("\n")
+    assert len(lines) == 4 * (CELL_HEIGHT + 1) + 2  # bottom border and final newline
+    assert lines[-1] == ""
+    assert lines[0].count(" ") == 3  # the entrance
+    assert lines[-2].count(" ") == 3  # the exit
+
+
+@pytest.mark.parametrize("rows,cols", [(1, 1), (1, 6), (9, 1), (13, 21)])
+def test_write_eller_maze_file(rows: int, cols: int, tmp_path: Path) -> None:
+    path = tmp_path / "maze.bin"
+
+    with open(path, "wb") as file:
+        header = write_eller_maze_file(file, rows, cols, seed=5)
+
+    assert path.stat().st_size == HEADER.size + rows * ((cols + 3) // 4)
+    with MazeFile(str(path)) as maze_file:
+        assert maze_file.header == header
+        grid = maze_file.to_grid()
+    assert header.seed == 5 and header.algorithm == "eller"
+    assert validate_maze(grid).is_perfect
+    assert find_entrance(grid) == header.entrance
+    assert header.entrance is not None and header.entrance[0] == 0
+    assert rows * cols == 1 or header.goal != header.entrance
+    assert solve_maze(grid) is not None
+
+
+def test_write_eller_maze_file_is_reproducible() -> None:
+    first, second = io.BytesIO(), io.BytesIO()
+
+    write_eller_maze_file(first, 20, 30, seed=11)
+    write_eller_maze_file(second, 20, 30, seed=11)
+
+    assert first.getvalue() == second.getvalue()
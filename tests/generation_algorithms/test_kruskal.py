@@ -0,0 +1,22 @@
+import pytest
+
+from generation_algorithms.kruskal import generate_kruskal_maze
+from tests.generation_algorithms.spanning_trees import count_2x2_spanning_trees
+
+
+@pytest.mark.parametrize(
+    "rows,cols", [(1, 1), (2, 2), (5, 5), (10, 10), (1, 10), (10, 1), (30, 40)]
+)
+def test_maze_accessibility(rows: int, cols: int) -> None:
+    grid = generate_kruskal_maze(rows, cols)
+
+    assert grid.all_cells_accessible(), "Some cells are inaccessible!"
+    assert all(grid.is_visited(index) for index in range(grid.size))
+    assert list(grid.contents.values()) == ["X"]
+
+
+def test_maze_is_a_spanning_tree() -> None:
+    # Kruskal is not uniform in general, but every spanning tree of a 2x2 grid is reachable
+    trees = count_2x2_spanning_trees(generate_kruskal_maze, 400, seed=3)
+
+    assert len(trees) == 4
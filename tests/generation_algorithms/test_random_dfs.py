@@ -0,0 +1,24 @@
+import sys
+
+import pytest
+
+from generation_algorithms.random_dfs import generate_random_dfs_maze
+
+
+@pytest.mark.parametrize(
+    "rows,cols", [(1, 1), (2, 2), (5, 5), (10, 10), (1, 10), (10, 1), (30, 40)]
+)
+def test_maze_accessibility(rows: int, cols: int) -> None:
+    grid = generate_random_dfs_maze(rows, cols)
+
+    assert grid.all_cells_accessible(), "Some cells are inaccessible!"
+    assert all(grid.is_visited(index) for index in range(grid.size))
+    assert list(grid.contents.values()) == ["X"]
+
+
+def test_deeper_than_recursion_limit() -> None:
+    # A single row is one corridor: the search goes as deep as the number of cells
+    cols = sys.getrecursionlimit() * 5
+    grid = generate_random_dfs_maze(1, cols)
+
+    assert grid.all_cells_accessible()
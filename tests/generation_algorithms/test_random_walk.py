@@ -0,0 +1,46 @@
+import random
+from collections import Counter
+from itertools import islice
+
+from enums.direction_enums import QuadDirection
+from generation_algorithms.random_walk import (
+    STEP_SLOTS,
+    get_step_bases,
+    get_step_table,
+    iter_random_steps,
+)
+
+
+def test_step_table_reaches_every_neighbour_evenly() -> None:
+    rows, cols = 3, 4
+    step_bases = get_step_bases(rows, cols)
+    offsets, directions = get_step_table(cols)
+
+    for index in range(rows * cols):
+        r, c = divmod(index, cols)
+        expected = {
+            ((r + d.value[0]) * cols + c + d.value[1], d)
+            for d in QuadDirection
+            if 0 <= r + d.value[0] < rows and 0 <= c + d.value[1] < cols
+        }
+        base = step_bases[index]
+        reached = Counter(
+            (index + offsets[base + s], directions[base + s]) for s in range(STEP_SLOTS)
+        )
+
+        assert set(reached) == expected
+        assert len(set(reached.values())) == 1
+
+
+def test_step_bases_single_row_and_column() -> None:
+    assert len(get_step_bases(1, 5)) == 5
+    assert len(get_step_bases(5, 1)) == 5
+    assert get_step_bases(1, 1) == bytearray([0])
+
+
+def test_iter_random_steps_in_range() -> None:
+    steps = list(islice(iter_random_steps(random.Random(0)), 120_000))
+
+    counts = Counter(steps)
+    assert set(counts) == set(range(STEP_SLOTS))
+    assert all(9_000 < count < 11_000 for count in counts.values())
@@ -0,0 +1,17 @@
+import random
+
+import pytest
+
+from generation_algorithms.registry import GENERATORS
+
+
+@pytest.mark.parametrize("algorithm", list(GENERATORS))
+def test_seed_algorithm_and_size_give_the_same_maze(algorithm: str) -> None:
+    generate = GENERATORS[algorithm]
+
+    first = generate(7, 9, rng=random.Random(42))
+    second = generate(7, 9, rng=random.Random(42))
+
+    assert first.all_cells_accessible()
+    assert first.walls == second.walls
+    assert first.contents == second.contents
@@ -0,0 +1,51 @@
+import pytest
+
+from components.grid import Grid, get_wall_regions
+from enums.direction_enums import WALL_BITS, QuadDirection
+from generation_algorithms.aldous_broder import generate_aldous_broder_maze_fast
+from generation_algorithms.registry import MazeGenerator
+from generation_algorithms.tiled import generate_tiled_maze
+from generation_algorithms.wilson import generate_wilson_maze
+
+
+def count_passages(grid: Grid) -> int:
+    east, south = WALL_BITS[QuadDirection.EAST], WALL_BITS[QuadDirection.SOUTH]
+    return sum(
+        (c < grid.cols - 1 and not grid.walls[r * grid.cols + c] & east)
+        + (r < grid.rows - 1 and not grid.walls[r * grid.cols + c] & south)
+        for r in range(grid.rows)
+        for c in range(grid.cols)
+    )
+
+
+@pytest.mark.parametrize(
+    "rows,cols,tile_rows,tile_cols",
+    [(1, 1, 4, 4), (20, 30, 7, 8), (20, 30, 20, 30), (1, 25, 1, 6), (25, 1, 6, 1)],
+)
+def test_tiled_maze_is_perfect(
+    rows: int, cols: int, tile_rows: int, tile_cols: int
+) -> None:
+    grid = generate_tiled_maze(rows, cols, tile_rows, tile_cols, max_workers=2)
+
+    assert grid.all_cells_accessible(), "Some cells are inaccessible!"
+    assert get_wall_regions(grid.walls, rows, cols).count == 1
+    assert all(grid.is_visited(index) for index in range(grid.size))
+    assert count_passages(grid) == rows * cols - 1
+    assert list(grid.contents.values()) == ["X"]
+
+
+@pytest.mark.parametrize(
+    "generate", [generate_aldous_broder_maze_fast, generate_wilson_maze]
+)
+def test_tiled_maze_with_other_generators(
+    generate: MazeGenerator,
+) -> None:
+    grid = generate_tiled_maze(12, 12, 5, 5, generate, max_workers=2)
+
+    assert grid.all_cells_accessible()
+    assert count_passages(grid) == 12 * 12 - 1
+
+
+def test_invalid_tile_size() -> None:
+    with pytest.raises(ValueError):
+        generate_tiled_maze(4, 4, 0, 4)
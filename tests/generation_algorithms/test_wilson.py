@@ -0,0 +1,42 @@
+from functools import partial
+
+import pytest
+
+from generation_algorithms.registry import MazeGenerator
+from generation_algorithms.wilson import (
+    generate_aldous_broder_wilson_maze,
+    generate_wilson_maze,
+)
+from tests.generation_algorithms.spanning_trees import count_2x2_spanning_trees
+
+GENERATORS: list[MazeGenerator] = [
+    generate_wilson_maze,
+    generate_aldous_broder_wilson_maze,
+    partial(generate_aldous_broder_wilson_maze, switch_fraction=0),
+    partial(generate_aldous_broder_wilson_maze, switch_fraction=1),
+]
+
+
+@pytest.mark.parametrize("generate", GENERATORS)
+@pytest.mark.parametrize(
+    "rows,cols", [(1, 1), (2, 2), (5, 5), (1, 10), (10, 1), (30, 40)]
+)
+def test_maze_accessibility(generate: MazeGenerator, rows: int, cols: int) -> None:
+    grid = generate(rows, cols)
+
+    assert grid.all_cells_accessible(), "Some cells are inaccessible!"
+    assert all(grid.is_visited(index) for index in range(grid.size))
+    assert list(grid.contents.values()) == ["X"]
+
+
+@pytest.mark.parametrize("generate", GENERATORS)
+def test_maze_is_uniform_spanning_tree(generate: MazeGenerator) -> None:
+    trees = count_2x2_spanning_trees(generate, 1200, seed=2)
+
+    assert len(trees) == 4
+    assert all(240 < count < 360 for count in trees.values())
+
+
+def test_invalid_switch_fraction() -> None:
+    with pytest.raises(ValueError):
+        generate_aldous_broder_wilson_maze(3, 3, 1.5)
@@ -0,0 +1,94 @@
+import random
+from collections import deque
+from itertools import pairwise
+
+import pytest
+
+from components.grid import Grid
+from enums.direction_enums import WALL_BITS, QuadDirection
+from generation_algorithms.registry import GENERATORS
+from solving_algorithms.bfs import (
+    find_content,
+    find_entrance,
+    get_shortest_path,
+    solve_maze,
+)
+
+
+def get_distance(grid: Grid, start: tuple[int, int], goal: tuple[int, int]) -> int:
+    # Reference BFS over the Cell API
+    distances = {start: 0}
+    queue = deque([grid.get_cell(*start)])
+    while queue:
+        cell = queue.popleft()
+        for _, neighbour in grid.get_accessible_neighbours(cell):
+            if neighbour.pos not in distances:
+                distances[neighbour.pos] = distances[cell.pos] + 1
+                queue.append(neighbour)
+    return distances.get(goal, -1)
+
+
+def assert_valid_path(grid: Grid, path: list[tuple[int, int]]) -> None:
+    for (r, c), next_pos in pairwise(path):
+        direction = QuadDirection((next_pos[0] - r, next_pos[1] - c))
+        assert not grid.walls[r * grid.cols + c] & WALL_BITS[direction]
+
+
+@pytest.mark.parametrize("algorithm", list(GENERATORS))
+def test_solve_maze(algorithm: str) -> None:
+    grid = GENERATORS[algorithm](12, 17, rng=random.Random(5))
+    entrance, goal = find_entrance(grid), find_content(grid, "X")
+    assert entrance is not None and goal is not None
+
+    result = solve_maze(grid)
+
+    assert result is not None
+    path, length = result
+    assert path[0] == entrance and path[-1] == goal
+    assert length == len(path) - 1 == get_distance(grid, entrance, goal)
+    assert_valid_path(grid, path)
+
+
+@pytest.mark.parametrize("seed", range(10))
+def test_shortest_path_with_loops(seed: int) -> None:
+    rng = random.Random(seed)
+    grid = GENERATORS["random_dfs"](9, 11, rng=rng)
+    # Open extra walls so that there are several paths to choose from
+    for _ in range(40):
+        r, c = rng.randrange(grid.rows), rng.randrange(grid.cols)
+        direction = rng.choice(list(QuadDirection))
+        if grid.get_cell_coord_in_direction(grid.get_cell(r, c), direction):
+            grid.remove_grid_wall(r, c, direction)
+    start, goal = (rng.randrange(9), rng.randrange(11)), (8, 10)
+
+    result = get_shortest_path(grid, start, goal)
+
+    assert result is not None
+    path, length = result
+    assert path[0] == start and path[-1] == goal
+    assert length == get_distance(grid, start, goal)
+    assert_valid_path(grid, path)
+
+
+def test_unreachable_goal() -> None:
+    grid = Grid(3, 3)
+    grid.remove_grid_wall(0, 0, QuadDirection.EAST)
+
+    assert get_shortest_path(grid, (0, 0), (2, 2)) is None
+    assert solve_maze(grid) is None
+
+
+def test_start_is_goal() -> None:
+    assert get_shortest_path(Grid(1, 1), (0, 0), (0, 0)) == ([(0, 0)], 0)
+
+
+def test_opened_border_is_not_a_move() -> None:
+    grid = Grid(1, 3)
+    for c in range(3):
+        grid.remove_grid_wall(0, c, QuadDirection.NORTH)
+        grid.remove_grid_wall(0, c, QuadDirection.SOUTH)
+    grid.remove_grid_wall(0, 0, QuadDirection.WEST)
+    grid.remove_grid_wall(0, 2, QuadDirection.EAST)
+
+    assert get_shortest_path(grid, (0, 0), (0, 2)) is None
+    assert find_entrance(grid) == (0, 0)
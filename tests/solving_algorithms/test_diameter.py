@@ -0,0 +1,56 @@
+import random
+
+import pytest
+
+from components.grid import Grid
+from generation_algorithms.registry import GENERATORS
+from solving_algorithms.bfs import find_content, find_entrance, solve_maze
+from solving_algorithms.diameter import (
+    get_border_diameter,
+    get_diameter,
+    place_at_diameter,
+)
+from tests.solving_algorithms.test_bfs import get_distance
+
+
+def get_all_distances(grid: Grid) -> dict[tuple[tuple[int, int], tuple[int, int]], int]:
+    cells = grid.get_cells()
+    return {(a, b): get_distance(grid, a, b) for a in cells for b in cells}
+
+
+@pytest.mark.parametrize("algorithm", list(GENERATORS))
+@pytest.mark.parametrize("rows,cols", [(1, 1), (1, 7), (6, 1), (5, 8)])
+def test_diameter(algorithm: str, rows: int, cols: int) -> None:
+    grid = GENERATORS[algorithm](rows, cols, rng=random.Random(rows * cols))
+    distances = get_all_distances(grid)
+
+    first, second, distance = get_diameter(grid)
+
+    assert distance == max(distances.values())
+    assert distances[first, second] == distance
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_border_diameter(seed: int) -> None:
+    grid = GENERATORS["wilson"](6, 7, rng=random.Random(seed))
+    distances = get_all_distances(grid)
+    border = set(grid.get_border_cells())
+
+    entrance, goal, distance = get_border_diameter(grid)
+
+    assert entrance in border
+    assert distance == max(d for (a, _), d in distances.items() if a in border)
+    assert distances[entrance, goal] == distance
+
+
+def test_place_at_diameter() -> None:
+    grid = GENERATORS["random_dfs"](15, 20, rng=random.Random(1))
+
+    entrance, goal, distance = place_at_diameter(grid)
+
+    assert find_entrance(grid) == entrance
+    assert find_content(grid, "X") == goal
+    assert list(grid.contents.values()) == ["X"]
+    result = solve_maze(grid)
+    assert result is not None and result[1] == distance
+    assert grid.all_cells_accessible()
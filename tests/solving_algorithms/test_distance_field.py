@@ -0,0 +1,74 @@
+import random
+
+from components.grid import Grid
+from enums.direction_enums import QuadDirection
+from generation_algorithms.registry import GENERATORS
+from solving_algorithms.bfs import find_content
+from solving_algorithms.distance_field import (
+    MAX_DISTANCE_FIELDS,
+    get_distance_field,
+    get_moves_remaining,
+    is_wrong_turn,
+)
+from tests.solving_algorithms.test_bfs import get_distance
+
+
+def test_moves_remaining() -> None:
+    grid = GENERATORS["wilson"](8, 9, rng=random.Random(2))
+    goal = find_content(grid, "X")
+    assert goal is not None
+
+    for cell in grid.get_cells():
+        assert get_moves_remaining(grid, cell, goal) == get_distance(grid, cell, goal)
+
+
+def test_field_is_cached_per_goal() -> None:
+    grid = GENERATORS["random_dfs"](5, 5, rng=random.Random(0))
+
+    field = get_distance_field(grid, (0, 0))
+
+    assert get_distance_field(grid, (0, 0)) is field
+    assert get_distance_field(grid, (4, 4)) is not field
+    assert len(grid.distance_fields) == 2
+
+
+def test_removing_a_wall_invalidates_the_field() -> None:
+    grid = Grid(1, 3)
+    grid.remove_grid_wall(0, 0, QuadDirection.EAST)
+    assert get_moves_remaining(grid, (0, 2), (0, 0)) == -1
+
+    grid.remove_grid_wall(0, 1, QuadDirection.EAST)
+
+    assert not grid.distance_fields
+    assert get_moves_remaining(grid, (0, 2), (0, 0)) == 2
+
+
+def test_wrong_turn() -> None:
+    grid = Grid(1, 3)
+    grid.remove_grid_wall(0, 0, QuadDirection.EAST)
+    grid.remove_grid_wall(0, 1, QuadDirection.EAST)
+
+    assert is_wrong_turn(grid, (0, 1), (0, 0), (0, 2))
+    assert not is_wrong_turn(grid, (0, 1), (0, 2), (0, 2))
+
+
+def test_cell_view_edits_invalidate_the_field() -> None:
+    grid = Grid(1, 3)
+    grid.remove_grid_wall(0, 0, QuadDirection.EAST)
+    assert get_moves_remaining(grid, (0, 0), (0, 2)) == -1
+
+    grid.get_cell(0, 1).remove_wall(QuadDirection.EAST)
+    grid.get_cell(0, 2).remove_wall(QuadDirection.WEST)
+
+    assert get_moves_remaining(grid, (0, 0), (0, 2)) == 2
+
+
+def test_number_of_fields_is_bounded() -> None:
+    grid = GENERATORS["kruskal"](4, 4, rng=random.Random(0))
+
+    for col in range(4):
+        get_distance_field(grid, (0, col))
+    get_distance_field(grid, (3, 3))
+
+    assert len(grid.distance_fields) == MAX_DISTANCE_FIELDS
+    assert 0 not in grid.distance_fields  # the oldest field was dropped
@@ -0,0 +1,23 @@
+import random
+
+import pytest
+
+from components.grid import Grid
+from utils.helpers import get_cell_content, measure_generation
+
+
+def test_get_cell_content() -> None:
+    assert get_cell_content("X") == "X"
+    assert get_cell_content("") == " "
+    with pytest.raises(ValueError):
+        get_cell_content("XY")
+
+
+def test_measure_generation() -> None:
+    rng = random.Random(0)
+    grid, cells_per_second = measure_generation(Grid, 3, 4, rng=rng)
+
+    assert isinstance(grid, Grid)
+    assert grid.size == 12
+    assert cells_per_second > 0
+    assert grid.rng is rng
@@ -0,0 +1,29 @@
+from pathlib import Path
+
+from utils.mapped_files import CHUNK_SIZE, map_identity_array, map_temporary_file
+from utils.union_find import UnionFind
+
+
+def test_map_temporary_file(tmp_path: Path) -> None:
+    buffer = map_temporary_file(CHUNK_SIZE + 3, str(tmp_path), fill=7)
+
+    assert len(buffer) == CHUNK_SIZE + 3
+    assert buffer[:] == bytes([7]) * (CHUNK_SIZE + 3)
+    assert not list(tmp_path.iterdir())
+
+
+def test_map_identity_array(tmp_path: Path) -> None:
+    parents = map_identity_array(CHUNK_SIZE, str(tmp_path))
+
+    assert len(parents) == CHUNK_SIZE
+    assert parents[0] == 0 and parents[-1] == CHUNK_SIZE - 1
+    assert list(parents[:5]) == [0, 1, 2, 3, 4]
+
+
+def test_mapped_union_find(tmp_path: Path) -> None:
+    sets = UnionFind(6, str(tmp_path))
+
+    assert sets.union(0, 1) and sets.union(2, 1) and not sets.union(0, 2)
+    assert sets.is_connected(0, 2)
+    assert not sets.is_connected(0, 5)
+    assert sets.count == 4
@@ -0,0 +1,104 @@
+import io
+import random
+from pathlib import Path
+
+import pytest
+
+from components.grid import Grid
+from generation_algorithms.registry import GENERATORS
+from utils.maze_file import (
+    HEADER,
+    MazeFile,
+    MazeHeader,
+    pack_row,
+    read_maze,
+    unpack_row,
+    write_maze,
+)
+
+
+def save(grid: Grid, path: Path, seed: int | None = None, algorithm: str = "") -> None:
+    with open(path, "wb") as file:
+        write_maze(file, grid, seed, algorithm)
+
+
+@pytest.mark.parametrize("algorithm", list(GENERATORS))
+@pytest.mark.parametrize("rows,cols", [(1, 1), (1, 9), (7, 1), (6, 11)])
+def test_round_trip(algorithm: str, rows: int, cols: int, tmp_path: Path) -> None:
+    grid = GENERATORS[algorithm](rows, cols, rng=random.Random(8))
+    path = tmp_path / "maze.bin"
+
+    save(grid, path, seed=8, algorithm=algorithm)
+    loaded = read_maze(str(path))
+
+    assert loaded.walls == grid.walls
+    assert loaded.contents == grid.contents
+    assert loaded.all_cells_accessible()
+    assert path.stat().st_size == HEADER.size + rows * ((cols + 3) // 4)
+
+
+def test_lazy_cell_access(tmp_path: Path) -> None:
+    grid = GENERATORS["wilson"](9, 10, rng=random.Random(1))
+    path = tmp_path / "maze.bin"
+    save(grid, path, seed=1, algorithm="wilson")
+
+    with MazeFile(str(path)) as maze_file:
+        header = maze_file.header
+        assert (header.rows, header.cols, header.seed) == (9, 10, 1)
+        assert header.algorithm == "wilson"
+        assert header.goal is not None
+        assert grid.get_cell(*header.goal).content == "X"
+        for row in range(9):
+            assert maze_file.get_row_walls(row) == grid.get_row_walls(row)
+            for col in range(10):
+                assert maze_file.get_walls(row, col) == grid.walls[row * 10 + col]
+        with pytest.raises(IndexError):
+            maze_file.get_walls(9, 0)
+
+
+def test_header_without_seed() -> None:
+    header = MazeHeader(rows=3, cols=4)
+
+    assert MazeHeader.unpack(header.pack()) == header
+
+
+@pytest.mark.parametrize("seed", [-1, -(1 << 63), (1 << 63) - 1])
+def test_header_seeds(seed: int) -> None:
+    header = MazeHeader(rows=1, cols=1, seed=seed, algorithm="a" * 32)
+
+    assert MazeHeader.unpack(header.pack()) == header
+
+
+@pytest.mark.parametrize(
+    "header",
+    [
+        MazeHeader(rows=1, cols=1, seed=1 << 63),
+        MazeHeader(rows=1, cols=1, algorithm="a" * 33),
+        MazeHeader(rows=1, cols=1, algorithm="é"),
+    ],
+)
+def test_invalid_headers(header: MazeHeader) -> None:
+    with pytest.raises(ValueError):
+        header.pack()
+
+
+def test_pack_row() -> None:
+    masks = bytearray(range(16)) + bytearray([15])
+
+    packed = pack_row(masks)
+
+    assert len(packed) == 5
+    assert unpack_row(packed, 17) == bytearray(mask & 0b0110 for mask in masks)
+
+
+def test_invalid_files(tmp_path: Path) -> None:
+    path = tmp_path / "maze.bin"
+    path.write_bytes(b"NOPE" + bytes(HEADER.size))
+    with pytest.raises(ValueError, match="Not a maze file"):
+        MazeFile(str(path))
+
+    buffer = io.BytesIO()
+    write_maze(buffer, Grid(4, 4))
+    path.write_bytes(buffer.getvalue()[:-1])
+    with pytest.raises(ValueError, match="Truncated"):
+        MazeFile(str(path))
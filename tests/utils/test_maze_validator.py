@@ -0,0 +1,72 @@
+import random
+
+import pytest
+
+from components.grid import Grid
+from enums.direction_enums import WALL_BITS, QuadDirection
+from generation_algorithms.registry import GENERATORS
+from utils.maze_validator import validate_maze
+
+
+@pytest.mark.parametrize("algorithm", list(GENERATORS))
+@pytest.mark.parametrize("rows,cols", [(1, 1), (1, 6), (6, 1), (9, 13)])
+def test_generated_mazes_are_perfect(algorithm: str, rows: int, cols: int) -> None:
+    grid = GENERATORS[algorithm](rows, cols, rng=random.Random(4))
+
+    report = validate_maze(grid)
+
+    assert report.is_perfect
+    assert report.passages == rows * cols - 1
+    assert report.first_asymmetric_cell is None
+    assert report.border_openings >= 1
+
+
+def test_closed_grid() -> None:
+    report = validate_maze(Grid(3, 4))
+
+    assert report.is_symmetric
+    assert not report.is_connected
+    assert not report.is_tree
+    assert (report.passages, report.regions, report.border_openings) == (0, 12, 0)
+
+
+@pytest.mark.parametrize(
+    "direction,cell",
+    [(QuadDirection.EAST, (1, 2)), (QuadDirection.SOUTH, (1, 2))],
+)
+def test_asymmetric_wall(direction: QuadDirection, cell: tuple[int, int]) -> None:
+    grid = GENERATORS["random_dfs"](4, 5, rng=random.Random(1))
+    # Flip one side of a wall only
+    grid.walls[cell[0] * grid.cols + cell[1]] ^= WALL_BITS[direction]
+
+    report = validate_maze(grid)
+
+    assert report.asymmetric_walls == 1
+    assert report.first_asymmetric_cell == cell
+    assert not report.is_perfect
+
+
+def test_loop_is_not_a_tree() -> None:
+    grid = Grid(2, 2)
+    grid.remove_grid_wall(0, 0, QuadDirection.EAST)
+    grid.remove_grid_wall(0, 0, QuadDirection.SOUTH)
+    grid.remove_grid_wall(1, 1, QuadDirection.NORTH)
+    grid.remove_grid_wall(1, 1, QuadDirection.WEST)
+
+    report = validate_maze(grid)
+
+    assert report.is_symmetric and report.is_connected
+    assert report.passages == 4
+    assert not report.is_tree
+
+
+def test_connectivity_does_not_trust_grid_regions() -> None:
+    grid = Grid(1, 2)
+    assert grid.count_regions() == 2
+    # Written behind the back of Grid.regions
+    grid.walls[0] &= ~WALL_BITS[QuadDirection.EAST]
+    grid.walls[1] &= ~WALL_BITS[QuadDirection.WEST]
+
+    report = validate_maze(grid)
+
+    assert report.is_connected and report.is_tree
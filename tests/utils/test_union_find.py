@@ -0,0 +1,45 @@
+from utils.union_find import UnionFind
+
+
+def test_union_and_find() -> None:
+    sets = UnionFind(6)
+
+    assert sets.union(0, 1)
+    assert sets.union(2, 3)
+    assert sets.union(1, 3)
+    assert not sets.union(0, 2)
+
+    assert sets.count == 3
+    assert sets.is_connected(0, 3)
+    assert not sets.is_connected(0, 4)
+    assert sets.find(4) == 4
+
+
+def test_path_compression() -> None:
+    sets = UnionFind(5)
+    # Build a chain by hand, then check find flattens it
+    sets.parent[1:5] = sets.parent[0:4]
+
+    assert sets.find(4) == 0
+    assert list(sets.parent) == [0, 0, 0, 0, 0]
+
+
+def test_union_by_rank() -> None:
+    sets = UnionFind(4)
+    sets.union(0, 1)  # rank of the root of {0, 1} becomes 1
+
+    sets.union(2, sets.find(0))
+
+    assert sets.find(2) == sets.find(0) == sets.find(1)
+    assert sets.parent[2] == sets.find(0)
+
+
+def test_merge_singletons() -> None:
+    sets = UnionFind(8)
+
+    sets.merge_singletons(2, range(1, 5))
+
+    assert sets.count == 5
+    assert all(sets.is_connected(2, item) for item in range(1, 5))
+    assert not sets.is_connected(2, 5)
+    assert sets.union(0, 4) and sets.count == 4
@@ -0,0 +1,179 @@
+import asyncio
+import json
+from collections.abc import Awaitable, Callable
+from pathlib import Path
+
+import pytest
+
+from generation_algorithms.batch import generate_seeded_maze
+from utils.maze_file import MazeFile
+from web.load_test import get_percentile, run_load_test
+from web.server import MazeService, parse_maze_query
+
+Check = Callable[[MazeService, int], Awaitable[None]]
+
+
+def run_with_service(check: Check, **service_args: object) -> None:
+    """
+    Start a service on a free port, run check(service, port) and stop the service.
+    """
+
+    async def run() -> None:
+        service = MazeService(max_workers=1, **service_args)  # type: ignore[arg-type]
+        server = await service.start(port=0)
+        try:
+            await check(service, server.sockets[0].getsockname()[1])
+        finally:
+            await service.close()
+
+    asyncio.run(run())
+
+
+async def fetch(port: int, target: str) -> tuple[int, dict[str, str], bytes]:
+    reader, writer = await asyncio.open_connection("127.0.0.1", port)
+    writer.write(f"GET {target} HTTP/1.1\r\nConnection: close\r\n\r\n".encode())
+    response = await reader.read()
+    writer.close()
+
+    head, _, body = response.partition(b"\r\n\r\n")
+    status_line, *header_lines = head.decode("latin-1").split("\r\n")
+    headers = {}
+    for line in header_lines:
+        name, _, value = line.partition(":")
+        headers[name.lower()] = value.strip()
+    return int(status_line.split()[1]), headers, body
+
+
+def test_formats(tmp_path: Path) -> None:
+    grid = generate_seeded_maze("kruskal", 6, 9, seed=5)
+
+    async def check(service: MazeService, port: int) -> None:
+        query = "/maze?rows=6&cols=9&seed=5&algorithm=kruskal"
+
+        status, headers, body = await fetch(port, query)
+        assert status == 200
+        assert headers["content-type"].startswith("text/plain")
+        assert headers["x-maze-seed"] == "5"
+        assert body.decode() == str(grid)
+
+        status, _, body = await fetch(port, query + "&format=json")
+        maze = json.loads(body)
+        assert status == 200
+        assert (maze["rows"], maze["cols"], maze["seed"]) == (6, 9, 5)
+        assert maze["algorithm"] == "kruskal"
+        assert tuple(maze["goal"]) == next(
+            divmod(i, 9) for i, c in grid.contents.items() if c == "X"
+        )
+        walls = bytes(int(digit, 16) for row in maze["walls"] for digit in row)
+        assert walls == grid.walls
+
+        status, _, body = await fetch(port, query + "&format=binary")
+        assert status == 200
+        (tmp_path / "maze.maze").write_bytes(body)
+        with MazeFile(str(tmp_path / "maze.maze")) as maze_file:
+            assert maze_file.header.seed == 5
+            assert maze_file.to_grid().walls == grid.walls
+
+    run_with_service(check, warm_sizes=[])
+
+
+def test_repeated_requests_are_cached() -> None:
+    async def check(service: MazeService, port: int) -> None:
+        first = await fetch(port, "/maze?rows=5&cols=5&seed=1")
+        second = await fetch(port, "/maze?rows=5&cols=5&seed=1")
+
+        assert first[2] == second[2]
+        assert service.stats.generated == 1
+        assert service.stats.cache_hits == 1
+
+    run_with_service(check, warm_sizes=[])
+
+
+def test_warm_queue() -> None:
+    async def check(service: MazeService, port: int) -> None:
+        while service.get_warm_count(("eller", 4, 4)) < 2:
+            await asyncio.sleep(0.01)
+
+        status, headers, body = await fetch(port, "/maze?rows=4&cols=4&algorithm=eller")
+        assert status == 200
+        assert service.stats.warm_hits == 1
+        assert service.stats.generated == 0
+
+        # The seed reproduces the maze, in any format, without generating it again
+        seed = int(headers["x-maze-seed"])
+        assert body.decode() == str(generate_seeded_maze("eller", 4, 4, seed))
+        query = f"/maze?rows=4&cols=4&algorithm=eller&seed={seed}&format=json"
+        status, _, _ = await fetch(port, query)
+        assert status == 200
+        assert service.stats.generated == 0
+
+        # Other sizes are generated from a random seed
+        status, headers, _ = await fetch(port, "/maze?rows=3&cols=4&algorithm=eller")
+        assert status == 200
+        assert "x-maze-seed" in headers
+        assert service.stats.generated == 1
+
+    run_with_service(check, warm_sizes=[("eller", 4, 4)], warm_count=2)
+
+
+def test_errors() -> None:
+    async def check(service: MazeService, port: int) -> None:
+        assert (await fetch(port, "/nothing"))[0] == 404
+        assert (await fetch(port, "/maze?rows=4"))[0] == 400
+        assert (await fetch(port, "/maze?rows=4&cols=x"))[0] == 400
+        assert (await fetch(port, "/maze?rows=4&cols=4&algorithm=prim"))[0] == 400
+        assert (await fetch(port, "/maze?rows=4&cols=4&format=gif"))[0] == 400
+
+        status, _, body = await fetch(port, "/stats")
+        assert status == 200
+        assert json.loads(body)["requests"] == 6
+
+    run_with_service(check, warm_sizes=[])
+
+
+@pytest.mark.parametrize(
+    "query",
+    [
+        "cols=4",
+        "rows=0&cols=4",
+        "rows=2000&cols=2000",
+        f"rows=4&cols=4&seed={1 << 63}",
+    ],
+)
+def test_invalid_queries(query: str) -> None:
+    with pytest.raises(ValueError):
+        parse_maze_query(query)
+
+
+def test_parse_maze_query() -> None:
+    assert parse_maze_query("rows=3&cols=4") == ("wilson", 3, 4, None, "text")
+    assert parse_maze_query("rows=3&cols=4&seed=-2&algorithm=eller&format=json") == (
+        "eller",
+        3,
+        4,
+        -2,
+        "json",
+    )
+
+
+def test_load_test() -> None:
+    async def check(service: MazeService, port: int) -> None:
+        result = await run_load_test(
+            "127.0.0.1", port, "/maze?rows=5&cols=5&seed=3", connections=4, requests=5
+        )
+        assert len(result.latencies) == 20
+        assert result.errors == 0
+        assert service.stats.generated == 1
+
+    run_with_service(check, warm_sizes=[])
+
+
+def test_percentile() -> None:
+    values = [float(v) for v in range(1, 101)]
+
+    assert get_percentile(values, 50) == 50
+    assert get_percentile(values, 99) == 99
+    assert get_percentile(values, 100) == 100
+    assert get_percentile(values, 0) == 1
+    with pytest.raises(ValueError):
+        get_percentile([], 50)
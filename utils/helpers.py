@@ -1,5 +1,12 @@
+import random
+import time
+from collections.abc import Callable
+from typing import TypeVar
+
 from utils.validators import check_type
 
+T = TypeVar("T")
+
 
 def get_cell_content(char: str) -> str:
     """
@@ -16,3 +23,24 @@ def get_cell_content(char: str) -> str:
         raise ValueError("The cell content must be exactly 1 character")
 
     return char
+
+
+def measure_generation(
+    generate: Callable[..., T],
+    rows: int,
+    cols: int,
+    rng: random.Random | None = None,
+) -> tuple[T, float]:
+    """
+    Run a maze generator and measure its throughput.
+    :param generate: Generator taking the grid rows and cols and an rng keyword,
+                     e.g. generate_aldous_broder_maze.
+    :param rows: Number of rows of the maze.
+    :param cols: Number of columns of the maze.
+    :param rng: Source of the random draws of the generator, e.g. random.Random(seed).
+    :return: The generated maze and the throughput in cells per second.
+    """
+    start = time.perf_counter()
+    maze = generate(rows, cols, rng=rng)
+    seconds = time.perf_counter() - start
+    return maze, rows * cols / seconds
@@ -0,0 +1,47 @@
+"""
+Arrays kept in files on disk and mapped into memory, for data larger than RAM.
+The files are anonymous temporary files: they are deleted as soon as they are unmapped.
+"""
+
+import mmap
+import tempfile
+from array import array
+
+# Bytes written at a time when filling a file
+CHUNK_SIZE: int = 1 << 20
+
+
+def map_temporary_file(
+    size: int, directory: str | None = None, fill: int = 0
+) -> mmap.mmap:
+    """
+    Map a new temporary file of size bytes into memory.
+    :param directory: Directory of the file, on a local disk; the system default if None.
+    :param fill: Value of every byte.
+    """
+    with tempfile.TemporaryFile(dir=directory) as file:
+        file.truncate(max(size, 1))  # empty files cannot be mapped
+        buffer = mmap.mmap(file.fileno(), max(size, 1))
+
+    if fill:
+        chunk = bytes([fill]) * CHUNK_SIZE
+        for start in range(0, size, CHUNK_SIZE):
+            end = min(start + CHUNK_SIZE, size)
+            buffer[start:end] = chunk[: end - start]
+    return buffer
+
+
+def map_identity_array(size: int, directory: str | None = None) -> memoryview:
+    """
+    Map a new temporary file holding the C ints 0..size-1, e.g. the parents of a UnionFind.
+    """
+    itemsize = array("i").itemsize
+    buffer = map_temporary_file(max(size, 1) * itemsize, directory)
+
+    step = CHUNK_SIZE // itemsize
+    for start in range(0, size, step):
+        end = min(start + step, size)
+        buffer[start * itemsize : end * itemsize] = array(
+            "i", range(start, end)
+        ).tobytes()
+    return memoryview(buffer).cast("i")[:size]
@@ -0,0 +1,300 @@
+"""
+Binary maze files.
+A file is a fixed-size header followed by 2 bits per cell: bit 0 is set if the cell has
+a south wall and bit 1 if it has an east wall. The north and west walls are the south and
+east walls of the neighbours, and the outer border is closed except at the entrance.
+Every row is packed into whole bytes, 4 cells per byte with the first cell in the low
+bits, so a row can be written and read on its own.
+"""
+
+import mmap
+import struct
+from collections.abc import Iterable
+from dataclasses import dataclass
+from typing import BinaryIO, Self
+
+from components.grid import Grid
+from enums.direction_enums import WALL_BITS, QuadDirection
+from solving_algorithms.bfs import find_content, find_entrance
+
+NORTH_BIT: int = WALL_BITS[QuadDirection.NORTH]
+SOUTH_BIT: int = WALL_BITS[QuadDirection.SOUTH]
+EAST_BIT: int = WALL_BITS[QuadDirection.EAST]
+WEST_BIT: int = WALL_BITS[QuadDirection.WEST]
+
+MAGIC: bytes = b"MAZE"
+VERSION: int = 1
+# magic, version, flags, rows, cols, seed, algorithm, entrance row and col,
+# open outer walls of the entrance, goal row and col; 76 bytes
+HEADER: struct.Struct = struct.Struct("<4sHHIIq32siiBxxxii")
+SEED_RANGE: range = range(-(1 << 63), 1 << 63)
+MAX_ALGORITHM_LENGTH: int = 32
+HAS_SEED_FLAG: int = 1
+
+# 2-bit code of every wall mask, shifted to each of the 4 positions of a packed byte
+_PACK: list[bytes] = [
+    bytes(
+        ((1 if mask & SOUTH_BIT else 0) | (2 if mask & EAST_BIT else 0)) << 2 * k
+        for mask in range(256)
+    )
+    for k in range(4)
+]
+# Wall mask of the code at each position of a packed byte, with the south and east walls
+_UNPACK: list[bytes] = [
+    bytes(
+        (SOUTH_BIT if byte >> 2 * k & 1 else 0) | (EAST_BIT if byte >> 2 * k & 2 else 0)
+        for byte in range(256)
+    )
+    for k in range(4)
+]
+# North wall of a cell from the mask of the cell above, and west wall from the one before
+_SOUTH_TO_NORTH: bytes = bytes(
+    NORTH_BIT if mask & SOUTH_BIT else 0 for mask in range(256)
+)
+_EAST_TO_WEST: bytes = bytes(WEST_BIT if mask & EAST_BIT else 0 for mask in range(256))
+
+
+@dataclass(frozen=True)
+class MazeHeader:
+    rows: int
+    cols: int
+    seed: int | None = None
+    algorithm: str = ""
+    entrance: tuple[int, int] | None = None
+    # Outer walls of the entrance cell that are open, as WALL_BITS
+    entrance_openings: int = 0
+    goal: tuple[int, int] | None = None
+
+    @property
+    def row_size(self) -> int:
+        """
+        Number of bytes of a packed row.
+        """
+        return (self.cols + 3) // 4
+
+    def pack(self) -> bytes:
+        if self.seed is not None and self.seed not in SEED_RANGE:
+            raise ValueError(
+                "The seed of a maze file must fit in a signed 64-bit integer"
+            )
+        if not self.algorithm.isascii() or len(self.algorithm) > MAX_ALGORITHM_LENGTH:
+            raise ValueError(
+                f"The algorithm name must be at most {MAX_ALGORITHM_LENGTH} ASCII characters"
+            )
+
+        entrance = self.entrance if self.entrance is not None else (-1, -1)
+        goal = self.goal if self.goal is not None else (-1, -1)
+        return HEADER.pack(
+            MAGIC,
+            VERSION,
+            HAS_SEED_FLAG if self.seed is not None else 0,
+            self.rows,
+            self.cols,
+            self.seed if self.seed is not None else 0,
+            self.algorithm.encode("ascii"),
+            *entrance,
+            self.entrance_openings,
+            *goal,
+        )
+
+    @classmethod
+    def unpack(cls, data: bytes) -> "MazeHeader":
+        (
+            magic,
+            version,
+            flags,
+            rows,
+            cols,
+            seed,
+            algorithm,
+            entrance_row,
+            entrance_col,
+            entrance_openings,
+            goal_row,
+            goal_col,
+        ) = HEADER.unpack(data)
+
+        if magic != MAGIC:
+            raise ValueError("Not a maze file")
+        if version != VERSION:
+            raise ValueError(f"Unsupported maze file version {version}")
+
+        return cls(
+            rows=rows,
+            cols=cols,
+            seed=seed if flags & HAS_SEED_FLAG else None,
+            algorithm=algorithm.rstrip(b"\0").decode("ascii"),
+            entrance=(entrance_row, entrance_col) if entrance_row >= 0 else None,
+            entrance_openings=entrance_openings,
+            goal=(goal_row, goal_col) if goal_row >= 0 else None,
+        )
+
+
+def pack_row(masks: bytes | bytearray) -> bytes:
+    """
+    Pack the wall masks of a row into 2 bits per cell.
+    The 4 positions of a byte are packed separately with bytes.translate and added up as
+    integers, which is the same as a bitwise or since their bits do not overlap.
+    """
+    padded = bytes(masks) + bytes(-len(masks) % 4)
+    packed = sum(
+        int.from_bytes(padded[k::4].translate(_PACK[k]), "little") for k in range(4)
+    )
+    return packed.to_bytes(len(padded) // 4, "little")
+
+
+def unpack_row(packed: bytes | bytearray, cols: int) -> bytearray:
+    """
+    Unpack a packed row into wall masks with only the south and east walls.
+    """
+    masks = bytearray(4 * len(packed))
+    for k in range(4):
+        masks[k::4] = packed.translate(_UNPACK[k])
+    del masks[cols:]
+    return masks
+
+
+def write_maze_rows(
+    file: BinaryIO, header: MazeHeader, rows: Iterable[bytes | bytearray]
+) -> None:
+    """
+    Write a maze file from the wall masks of its rows, one row in memory at a time.
+    :param rows: Wall masks of every row, top to bottom, e.g. from iter_eller_rows.
+    """
+    file.write(header.pack())
+    file.writelines(pack_row(masks) for masks in rows)
+
+
+def write_maze(
+    file: BinaryIO, grid: Grid, seed: int | None = None, algorithm: str = ""
+) -> None:
+    """
+    Write a Grid to a maze file.
+    The entrance is the cell opened by Grid.open_maze and the goal the cell marked "X";
+    other cell contents are not stored.
+    :param seed: Seed the maze was generated with, if any.
+    :param algorithm: Name of the generator, e.g. a key of the registry.
+    """
+    entrance = find_entrance(grid)
+    entrance_openings = 0
+    if entrance is not None:
+        r, c = entrance
+        outer_walls = (
+            (NORTH_BIT if r == 0 else 0)
+            | (SOUTH_BIT if r == grid.rows - 1 else 0)
+            | (WEST_BIT if c == 0 else 0)
+            | (EAST_BIT if c == grid.cols - 1 else 0)
+        )
+        entrance_openings = outer_walls & ~grid.walls[r * grid.cols + c]
+
+    header = MazeHeader(
+        rows=grid.rows,
+        cols=grid.cols,
+        seed=seed,
+        algorithm=algorithm,
+        entrance=entrance,
+        entrance_openings=entrance_openings,
+        goal=find_content(grid, "X"),
+    )
+    write_maze_rows(file, header, (grid.get_row_walls(row) for row in range(grid.rows)))
+
+
+class MazeFile:
+    """
+    A maze file mapped into memory. Opening it only reads the header; cells are decoded
+    when they are accessed, so even huge mazes open instantly.
+    """
+
+    def __init__(self, path: str):
+        with open(path, "rb") as file:
+            self.data: mmap.mmap = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            self.header: MazeHeader = MazeHeader.unpack(self.data[: HEADER.size])
+            if len(self.data) < HEADER.size + self.header.rows * self.header.row_size:
+                raise ValueError("Truncated maze file")
+        except (ValueError, struct.error):
+            self.data.close()
+            raise
+        self.rows: int = self.header.rows
+        self.cols: int = self.header.cols
+
+    def close(self) -> None:
+        self.data.close()
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def _get_code(self, row: int, col: int) -> int:
+        byte = self.data[HEADER.size + row * self.header.row_size + (col >> 2)]
+        return byte >> 2 * (col & 3) & 3
+
+    def get_walls(self, row: int, col: int) -> int:
+        """
+        Get the wall mask of a cell, see WALL_BITS.
+        """
+        if not (0 <= row < self.rows and 0 <= col < self.cols):
+            raise IndexError(f"Cell {(row, col)} is outside the maze")
+
+        code = self._get_code(row, col)
+        mask = (SOUTH_BIT if code & 1 else 0) | (EAST_BIT if code & 2 else 0)
+        if row == 0 or self._get_code(row - 1, col) & 1:
+            mask |= NORTH_BIT
+        if col == 0 or self._get_code(row, col - 1) & 2:
+            mask |= WEST_BIT
+
+        if (row, col) == self.header.entrance:
+            mask &= ~self.header.entrance_openings
+        return mask
+
+    def get_row_walls(self, row: int) -> bytearray:
+        """
+        Get the wall masks of a row, like Grid.get_row_walls.
+        """
+        if not 0 <= row < self.rows:
+            raise IndexError(f"Row {row} is outside the maze")
+
+        masks = unpack_row(self._get_packed_row(row), self.cols)
+        if row == 0:
+            north = bytes([NORTH_BIT]) * self.cols
+        else:
+            above = unpack_row(self._get_packed_row(row - 1), self.cols)
+            north = above.translate(_SOUTH_TO_NORTH)
+        west = bytes([WEST_BIT]) + masks[:-1].translate(_EAST_TO_WEST)
+
+        # The walls of the 3 sources do not overlap, so adding them is a bitwise or
+        mask_bytes = sum(
+            int.from_bytes(part, "little") for part in (masks, north, west)
+        ).to_bytes(self.cols, "little")
+        masks = bytearray(mask_bytes)
+
+        if self.header.entrance is not None and self.header.entrance[0] == row:
+            masks[self.header.entrance[1]] &= ~self.header.entrance_openings
+        return masks
+
+    def _get_packed_row(self, row: int) -> bytes:
+        start = HEADER.size + row * self.header.row_size
+        return self.data[start : start + self.header.row_size]
+
+    def to_grid(self, directory: str | None = None) -> Grid:
+        """
+        Load the whole maze into a Grid, with its goal marked "X".
+        :param directory: Keep the grid in memory-mapped files of this directory, see Grid.
+        """
+        grid = Grid(self.rows, self.cols, directory=directory)
+        for row in range(self.rows):
+            grid.walls[row * self.cols : (row + 1) * self.cols] = self.get_row_walls(
+                row
+            )
+        grid.set_all_visited()
+
+        if self.header.goal is not None:
+            grid.get_cell(*self.header.goal).set_cell_content("X")
+        return grid
+
+
+def read_maze(path: str) -> Grid:
+    with MazeFile(path) as maze_file:
+        return maze_file.to_grid()
@@ -0,0 +1,74 @@
+import mmap
+from array import array
+
+from utils.mapped_files import map_identity_array, map_temporary_file
+
+
+class UnionFind:
+    """
+    Disjoint sets of the integers 0..size-1, stored in flat arrays.
+    Uses union by rank and path compression, so operations cost O(α(size)).
+    """
+
+    __slots__ = ("count", "parent", "rank")
+
+    def __init__(self, size: int, directory: str | None = None):
+        """
+        :param directory: Keep the arrays in memory-mapped temporary files of this
+                          directory instead of RAM, see utils.mapped_files.
+        """
+        self.parent: array[int] | memoryview
+        self.rank: bytearray | mmap.mmap
+        if directory is None:
+            self.parent = array("i", range(size))
+            self.rank = bytearray(size)
+        else:
+            self.parent = map_identity_array(size, directory)
+            self.rank = map_temporary_file(size, directory)
+        self.count: int = size  # number of disjoint sets
+
+    def find(self, item: int) -> int:
+        parent = self.parent
+
+        root = item
+        while parent[root] != root:
+            root = parent[root]
+
+        # Path compression: point every item on the path straight at the root
+        while parent[item] != root:
+            parent[item], item = root, parent[item]
+
+        return root
+
+    def union(self, a: int, b: int) -> bool:
+        """
+        Merge the sets of a and b.
+        :return: False if a and b were already in the same set.
+        """
+        parent = self.parent
+        # Skip the find calls for roots, e.g. cells not yet joined to anything
+        root_a = a if parent[a] == a else self.find(a)
+        root_b = b if parent[b] == b else self.find(b)
+        if root_a == root_b:
+            return False
+
+        if self.rank[root_a] < self.rank[root_b]:
+            root_a, root_b = root_b, root_a
+        parent[root_b] = root_a
+        if self.rank[root_a] == self.rank[root_b]:
+            self.rank[root_a] += 1
+
+        self.count -= 1
+        return True
+
+    def merge_singletons(self, root: int, items: range) -> None:
+        """
+        Put items that are each still alone in their set into the set of root at once,
+        e.g. a row of a region known to be connected.
+        """
+        self.parent[items.start : items.stop] = array("i", [root]) * len(items)
+        self.rank[root] = max(self.rank[root], 1)
+        self.count -= len(items) - (root in items)
+
+    def is_connected(self, a: int, b: int) -> bool:
+        return self.find(a) == self.find(b)
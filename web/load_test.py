@@ -0,0 +1,112 @@
+"""
+Load test of the maze service: many clients send requests over keep-alive connections
+at the same time, and the latency percentiles are reported.
+Run with: python -m web.load_test --port 8080 --connections 50 --requests 200
+"""
+
+import argparse
+import asyncio
+import math
+import time
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True)
+class LoadTestResult:
+    latencies: list[float]  # seconds, sorted
+    errors: int
+    duration: float  # seconds
+
+    @property
+    def requests_per_second(self) -> float:
+        return len(self.latencies) / self.duration if self.duration else 0.0
+
+    def get_percentile(self, percent: float) -> float:
+        return get_percentile(self.latencies, percent)
+
+
+def get_percentile(sorted_values: list[float], percent: float) -> float:
+    """
+    Get a percentile of sorted values by the nearest-rank method.
+    :param percent: Between 0 and 100.
+    """
+    if not sorted_values:
+        raise ValueError("No values")
+    if not 0 <= percent <= 100:
+        raise ValueError("The percent must be between 0 and 100")
+    rank = max(math.ceil(percent / 100 * len(sorted_values)), 1)
+    return sorted_values[rank - 1]
+
+
+async def send_requests(
+    host: str, port: int, target: str, count: int, latencies: list[float]
+) -> int:
+    """
+    Send requests one after the other over one connection.
+    :return: The number of requests that failed.
+    """
+    reader, writer = await asyncio.open_connection(host, port)
+    request = f"GET {target} HTTP/1.1\r\nHost: {host}\r\n\r\n".encode("latin-1")
+    errors = 0
+    try:
+        for _ in range(count):
+            start = time.perf_counter()
+            writer.write(request)
+            status_line = await reader.readline()
+            content_length = 0
+            while (line := await reader.readline()) not in (b"\r\n", b""):
+                name, _, value = line.decode("latin-1").partition(":")
+                if name.lower() == "content-length":
+                    content_length = int(value)
+            await reader.readexactly(content_length)
+            latencies.append(time.perf_counter() - start)
+
+            if status_line.split()[1:2] != [b"200"]:
+                errors += 1
+    finally:
+        writer.close()
+    return errors
+
+
+async def run_load_test(
+    host: str, port: int, target: str, connections: int, requests: int
+) -> LoadTestResult:
+    """
+    :param target: Path and query of the requests, e.g. "/maze?rows=20&cols=20".
+    :param connections: Number of concurrent connections.
+    :param requests: Number of requests sent over each connection.
+    """
+    latencies: list[float] = []
+    start = time.perf_counter()
+    errors = await asyncio.gather(
+        *(
+            send_requests(host, port, target, requests, latencies)
+            for _ in range(connections)
+        )
+    )
+    duration = time.perf_counter() - start
+    return LoadTestResult(sorted(latencies), sum(errors), duration)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Load test the maze service.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8080)
+    parser.add_argument("--target", default="/maze?rows=20&cols=20&format=json")
+    parser.add_argument("--connections", type=int, default=50)
+    parser.add_argument("--requests", type=int, default=200)
+    args = parser.parse_args()
+
+    result = asyncio.run(
+        run_load_test(
+            args.host, args.port, args.target, args.connections, args.requests
+        )
+    )
+    print(f"{len(result.latencies)} requests, {result.errors} errors")
+    print(f"{result.requests_per_second:.0f} requests/s")
+    for percent in (50, 90, 99, 100):
+        print(f"p{percent}: {1000 * result.get_percentile(percent):.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,389 @@
+"""
+Asyncio HTTP service that serves mazes.
+
+    GET /maze?rows=20&cols=30&seed=7&algorithm=wilson&format=json
+    GET /stats
+
+rows and cols are required. Without a seed, a maze of a warm size is taken from a queue
+of pre-generated ones, or else generated from a random seed; the seed that was used is
+returned in the X-Maze-Seed header either way, so the maze can be requested again.
+Formats are "text" (the rendering of Grid.__str__), "json" and "binary" (a maze file,
+see utils.maze_file).
+
+Mazes are generated and serialized on a process pool, so the event loop only parses
+requests and writes responses, and recently served responses are cached.
+Run with: python -m web.server --port 8080
+"""
+
+import argparse
+import asyncio
+import io
+import json
+import random
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import asdict, dataclass
+from urllib.parse import parse_qs, urlsplit
+
+from components.grid import Grid
+from generation_algorithms.batch import generate_seeded_maze
+from generation_algorithms.registry import get_generator
+from solving_algorithms.bfs import find_content, find_entrance
+from utils.maze_file import SEED_RANGE, write_maze
+
+CONTENT_TYPES: dict[str, str] = {
+    "text": "text/plain; charset=utf-8",
+    "json": "application/json",
+    "binary": "application/octet-stream",
+}
+DEFAULT_ALGORITHM: str = "wilson"
+MAX_CELLS: int = 1_000_000
+# (algorithm, rows, cols) of the mazes kept pre-generated by default
+WARM_SIZES: list[tuple[str, int, int]] = [
+    (DEFAULT_ALGORITHM, 10, 10),
+    (DEFAULT_ALGORITHM, 20, 20),
+    (DEFAULT_ALGORITHM, 50, 50),
+]
+REASONS: dict[int, str] = {
+    200: "OK",
+    400: "Bad Request",
+    404: "Not Found",
+    405: "Method Not Allowed",
+    500: "Internal Server Error",
+}
+
+# Hex digit of every wall mask, see to_json
+_HEX_DIGITS: bytes = b"0123456789abcdef" + bytes(240)
+
+MazeKey = tuple[str, int, int, int]
+
+
+@dataclass
+class ServiceStats:
+    requests: int = 0
+    warm_hits: int = 0  # served from a warm queue
+    cache_hits: int = 0  # served from the response cache
+    generated: int = 0  # generated for the request
+
+
+@dataclass(frozen=True)
+class Response:
+    status: int
+    body: bytes
+    content_type: str = CONTENT_TYPES["text"]
+    seed: int | None = None
+
+
+def to_json(grid: Grid, algorithm: str, seed: int) -> bytes:
+    """
+    Serialize a maze as JSON. Each row of "walls" is a string with the wall mask of
+    every cell as one hex digit, see WALL_BITS.
+    """
+    maze = {
+        "algorithm": algorithm,
+        "rows": grid.rows,
+        "cols": grid.cols,
+        "seed": seed,
+        "entrance": find_entrance(grid),
+        "goal": find_content(grid, "X"),
+        "walls": [
+            bytes(grid.get_row_walls(row)).translate(_HEX_DIGITS).decode("ascii")
+            for row in range(grid.rows)
+        ],
+    }
+    return json.dumps(maze, separators=(",", ":")).encode()
+
+
+def to_binary(grid: Grid, algorithm: str, seed: int) -> bytes:
+    file = io.BytesIO()
+    write_maze(file, grid, seed=seed, algorithm=algorithm)
+    return file.getvalue()
+
+
+def render_maze(
+    algorithm: str, grid_rows: int, grid_cols: int, seed: int, formats: tuple[str, ...]
+) -> dict[str, bytes]:
+    """
+    Generate a maze and serialize it in each of the formats.
+    Runs in the worker processes of the service.
+    """
+    grid = generate_seeded_maze(algorithm, grid_rows, grid_cols, seed)
+    payloads = {}
+    for maze_format in formats:
+        if maze_format == "text":
+            payloads[maze_format] = str(grid).encode()
+        elif maze_format == "json":
+            payloads[maze_format] = to_json(grid, algorithm, seed)
+        else:
+            payloads[maze_format] = to_binary(grid, algorithm, seed)
+    return payloads
+
+
+def parse_maze_query(query: str) -> tuple[str, int, int, int | None, str]:
+    """
+    Parse and check the query of a /maze request.
+    :return: The algorithm, rows, cols, seed or None, and format.
+    :raises ValueError: If a parameter is missing or invalid.
+    """
+    params = {name: values[-1] for name, values in parse_qs(query).items()}
+
+    def get_int(name: str) -> int | None:
+        if name not in params:
+            return None
+        try:
+            return int(params[name])
+        except ValueError:
+            raise ValueError(f"{name} must be an integer") from None
+
+    grid_rows, grid_cols = get_int("rows"), get_int("cols")
+    if grid_rows is None or grid_cols is None:
+        raise ValueError("rows and cols are required")
+    if grid_rows < 1 or grid_cols < 1:
+        raise ValueError("rows and cols must be at least 1")
+    if grid_rows * grid_cols > MAX_CELLS:
+        raise ValueError(f"Mazes have at most {MAX_CELLS} cells")
+
+    seed = get_int("seed")
+    if seed is not None and seed not in SEED_RANGE:
+        raise ValueError("seed must fit in a signed 64-bit integer")
+
+    algorithm = params.get("algorithm", DEFAULT_ALGORITHM)
+    get_generator(algorithm)
+
+    maze_format = params.get("format", "text")
+    if maze_format not in CONTENT_TYPES:
+        raise ValueError(f"format must be one of {', '.join(CONTENT_TYPES)}")
+
+    return algorithm, grid_rows, grid_cols, seed, maze_format
+
+
+class MazeService:
+    """
+    Serves mazes over HTTP/1.1, with keep-alive connections.
+    """
+
+    def __init__(
+        self,
+        max_workers: int | None = None,
+        warm_sizes: list[tuple[str, int, int]] | None = None,
+        warm_count: int = 8,
+        max_cached_bytes: int = 64 << 20,
+    ):
+        """
+        :param max_workers: Number of worker processes, defaults to the number of CPUs.
+        :param warm_sizes: (algorithm, rows, cols) of the mazes to keep pre-generated,
+                           WARM_SIZES by default.
+        :param warm_count: Number of mazes kept pre-generated for each warm size.
+        :param max_cached_bytes: Limit of the size of the cached responses.
+        """
+        self.executor: ProcessPoolExecutor = ProcessPoolExecutor(max_workers)
+        self.warm_sizes: list[tuple[str, int, int]] = (
+            warm_sizes if warm_sizes is not None else WARM_SIZES
+        )
+        self.warm_count: int = warm_count
+        self.max_cached_bytes: int = max_cached_bytes
+        self.stats: ServiceStats = ServiceStats()
+        self.rng: random.Random = random.Random()
+        self.cached_bytes: int = 0
+        self._responses: OrderedDict[tuple[MazeKey, str], bytes] = OrderedDict()
+        self._warm: dict[tuple[str, int, int], asyncio.Queue] = {}
+        self._tasks: list[asyncio.Task] = []
+        self._server: asyncio.Server | None = None
+
+    async def start(self, host: str = "127.0.0.1", port: int = 8080) -> asyncio.Server:
+        """
+        Start listening and filling the warm queues.
+        :param port: Port to listen on, any free port if 0.
+        """
+        for size in self.warm_sizes:
+            get_generator(size[0])
+            self._warm[size] = asyncio.Queue(maxsize=self.warm_count)
+            self._tasks.append(asyncio.create_task(self._fill_warm_queue(size)))
+
+        self._server = await asyncio.start_server(self.handle_connection, host, port)
+        return self._server
+
+    async def close(self) -> None:
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks.clear()
+
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+        self.executor.shutdown(cancel_futures=True)
+
+    async def _fill_warm_queue(self, size: tuple[str, int, int]) -> None:
+        loop = asyncio.get_running_loop()
+        queue = self._warm[size]
+        while True:
+            seed = self.rng.getrandbits(63)
+            payloads = await loop.run_in_executor(
+                self.executor, render_maze, *size, seed, tuple(CONTENT_TYPES)
+            )
+            await queue.put((seed, payloads))  # waits while the queue is full
+
+    def get_warm_count(self, size: tuple[str, int, int]) -> int:
+        """
+        Get the number of pre-generated mazes ready for a warm size.
+        """
+        queue = self._warm.get(size)
+        return queue.qsize() if queue is not None else 0
+
+    async def get_maze(
+        self,
+        algorithm: str,
+        grid_rows: int,
+        grid_cols: int,
+        seed: int | None,
+        maze_format: str,
+    ) -> tuple[int, bytes]:
+        """
+        Get a serialized maze, generating it on the process pool if needed.
+        :param seed: Seed of the maze, any if None.
+        :return: The seed of the maze and its serialization.
+        """
+        size = (algorithm, grid_rows, grid_cols)
+
+        if seed is None:
+            queue = self._warm.get(size)
+            if queue is not None and not queue.empty():
+                seed, payloads = queue.get_nowait()
+                self.stats.warm_hits += 1
+                # Keep the other formats, the client may ask for them next
+                for other_format, payload in payloads.items():
+                    self._cache_response((*size, seed), other_format, payload)
+                return seed, payloads[maze_format]
+            seed = self.rng.getrandbits(63)
+
+        key = (*size, seed)
+        payload = self._responses.get((key, maze_format))
+        if payload is not None:
+            self._responses.move_to_end((key, maze_format))
+            self.stats.cache_hits += 1
+            return seed, payload
+
+        loop = asyncio.get_running_loop()
+        payloads = await loop.run_in_executor(
+            self.executor, render_maze, *key, (maze_format,)
+        )
+        self.stats.generated += 1
+        self._cache_response(key, maze_format, payloads[maze_format])
+        return seed, payloads[maze_format]
+
+    def _cache_response(self, key: MazeKey, maze_format: str, payload: bytes) -> None:
+        if len(payload) > self.max_cached_bytes or (key, maze_format) in self._responses:
+            return
+
+        self._responses[(key, maze_format)] = payload
+        self.cached_bytes += len(payload)
+        while self.cached_bytes > self.max_cached_bytes:
+            _, evicted = self._responses.popitem(last=False)
+            self.cached_bytes -= len(evicted)
+
+    async def respond(self, method: str, target: str) -> Response:
+        """
+        Build the response to a request.
+        """
+        url = urlsplit(target)
+        if url.path not in ("/maze", "/stats"):
+            return Response(404, b"Not found\n")
+        if method != "GET":
+            return Response(405, b"Only GET is supported\n")
+
+        if url.path == "/stats":
+            stats = asdict(self.stats)
+            stats["cached_responses"] = len(self._responses)
+            stats["cached_bytes"] = self.cached_bytes
+            body = json.dumps(stats).encode()
+            return Response(200, body, CONTENT_TYPES["json"])
+
+        try:
+            algorithm, grid_rows, grid_cols, seed, maze_format = parse_maze_query(
+                url.query
+            )
+            seed, body = await self.get_maze(
+                algorithm, grid_rows, grid_cols, seed, maze_format
+            )
+        except ValueError as e:
+            return Response(400, f"{e}\n".encode())
+        return Response(200, body, CONTENT_TYPES[maze_format], seed)
+
+    async def handle_connection(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        try:
+            while True:
+                request_line = await reader.readline()
+                if not request_line:
+                    break
+
+                headers = {}
+                while (line := await reader.readline()) not in (b"\r\n", b"\n", b""):
+                    name, _, value = line.decode("latin-1").partition(":")
+                    headers[name.strip().lower()] = value.strip().lower()
+
+                try:
+                    method, target, version = request_line.decode("latin-1").split()
+                except ValueError:
+                    writer.write(encode_response(Response(400, b"Bad request\n")))
+                    break
+
+                self.stats.requests += 1
+                try:
+                    response = await self.respond(method, target)
+                except Exception:
+                    response = Response(500, b"Internal server error\n")
+
+                keep_alive = (
+                    version == "HTTP/1.1"
+                    and headers.get("connection") != "close"
+                    and method == "GET"
+                )
+                writer.write(encode_response(response, keep_alive))
+                await writer.drain()
+                if not keep_alive:
+                    break
+        except (ConnectionError, asyncio.LimitOverrunError, ValueError):
+            pass  # the client went away or sent garbage
+        finally:
+            writer.close()
+
+
+def encode_response(response: Response, keep_alive: bool = False) -> bytes:
+    head = [
+        f"HTTP/1.1 {response.status} {REASONS[response.status]}",
+        f"Content-Type: {response.content_type}",
+        f"Content-Length: {len(response.body)}",
+        f"Connection: {'keep-alive' if keep_alive else 'close'}",
+    ]
+    if response.seed is not None:
+        head.append(f"X-Maze-Seed: {response.seed}")
+    return ("\r\n".join(head) + "\r\n\r\n").encode("latin-1") + response.body
+
+
+async def serve(host: str, port: int, max_workers: int | None) -> None:
+    service = MazeService(max_workers)
+    server = await service.start(host, port)
+    print(f"Serving mazes on {', '.join(str(s.getsockname()) for s in server.sockets)}")
+    try:
+        await server.serve_forever()
+    finally:
+        await service.close()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Serve mazes over HTTP.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8080)
+    parser.add_argument("--workers", type=int, default=None)
+    args = parser.parse_args()
+    try:
+        asyncio.run(serve(args.host, args.port, args.workers))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()